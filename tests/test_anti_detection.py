@@ -0,0 +1,324 @@
+"""
+Tests for request analytics and anti-detection utilities.
+"""
+
+from collections import deque
+import time
+from unittest.mock import patch
+
+from youtube_toolkit.utils.anti_detection import RequestAnalytics, RequestRecord
+
+
+class TestRequestAnalytics:
+    """Tests for RequestAnalytics."""
+
+    def _record(self, age_minutes: float, success: bool = True) -> RequestRecord:
+        return RequestRecord(
+            timestamp=time.monotonic() - age_minutes * 60,
+            url='https://youtube.com', method='get', success=success,
+            response_time=0.1, user_agent='ua'
+        )
+
+    def _record_at(self, analytics, second: float, success: bool = True):
+        with patch('youtube_toolkit.utils.anti_detection.time.monotonic', return_value=second):
+            analytics.record_request('https://youtube.com', 'get', success, 0.1, 'ua')
+
+    def _at(self, second: float):
+        return patch('youtube_toolkit.utils.anti_detection.time.monotonic', return_value=second)
+
+    def test_old_records_are_pruned(self):
+        """Test that records outside the window are dropped when a new one arrives."""
+        analytics = RequestAnalytics(window_minutes=60)
+        analytics.requests = deque([self._record(90), self._record(61), self._record(30)])
+
+        analytics.record_request('https://youtube.com', 'get', True, 0.1, 'ua')
+
+        assert isinstance(analytics.requests, deque)
+        assert len(analytics.requests) == 2
+
+    def test_recent_requests_window(self):
+        """Test that only requests inside the asked window are returned, oldest first."""
+        analytics = RequestAnalytics()
+        old, mid, new = self._record(20), self._record(4), self._record(1)
+        analytics.requests = deque([old, mid, new])
+
+        assert analytics.get_recent_requests(5) == [mid, new]
+
+    def test_count_recent_requests(self):
+        """Test that recent requests are counted without building a list."""
+        analytics = RequestAnalytics()
+        analytics.requests = deque([self._record(20), self._record(4), self._record(1)])
+
+        assert analytics.count_recent_requests(5) == 2
+        assert analytics.count_recent_requests(30) == 3
+        assert not analytics.lock.locked()
+
+    def test_clock_is_read_under_lock(self):
+        """Test that the timestamp is taken while holding the lock, so records stay ordered."""
+        analytics = RequestAnalytics()
+        held = []
+
+        def clock():
+            held.append(analytics.lock.locked())
+            return 100.0
+
+        with patch('youtube_toolkit.utils.anti_detection.time.monotonic', side_effect=clock):
+            analytics.record_request('https://youtube.com', 'get', True, 0.1, 'ua')
+
+        assert held and all(held)
+
+    def test_records_are_slotted_and_frozen(self):
+        """Test that records carry no per-instance dict and cannot be changed."""
+        import dataclasses
+        import pytest
+
+        record = self._record(1)
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.success = False
+
+    def test_user_agents_and_methods_are_shared(self):
+        """Test that records keep the given values and share one copy of each string."""
+        analytics = RequestAnalytics()
+        analytics.record_request('https://a', 'get', True, 0.1, ''.join(['ua-', '1']))
+        analytics.record_request('https://b', 'HEAD', True, 0.1, 'ua-2')
+        analytics.record_request('https://c', 'get', True, 0.1, ''.join(['ua-', '1']))
+
+        first, second, third = analytics.requests
+        assert (first.user_agent, second.user_agent) == ('ua-1', 'ua-2')
+        assert first.user_agent is third.user_agent
+        assert (first.method, second.method) == ('get', 'HEAD')
+
+    def test_frequency_and_success_from_counters(self):
+        """Test that per-second counters give frequency and success rate over a window."""
+        analytics = RequestAnalytics(window_minutes=60)
+        self._record_at(analytics, 1000.0)
+        self._record_at(analytics, 1200.0, success=False)
+        self._record_at(analytics, 1290.0)
+        self._record_at(analytics, 1290.5)
+
+        with self._at(1300.0):
+            assert analytics.get_request_frequency(5) == 3 / 5
+            assert analytics.get_success_rate(5) == 2 / 3
+            assert analytics.get_request_frequency(10) == 4 / 10
+
+    def test_idle_defaults(self):
+        """Test defaults when nothing was recorded in the window."""
+        analytics = RequestAnalytics()
+        assert analytics.get_request_frequency(5) == 0.0
+        assert analytics.get_success_rate(10) == 1.0
+
+    def test_counters_wrap_around_window(self):
+        """Test that slots reused after a full window do not keep stale counts."""
+        analytics = RequestAnalytics(window_minutes=1)
+        self._record_at(analytics, 100.0)
+        self._record_at(analytics, 159.0)
+        self._record_at(analytics, 160.0)   # reuses the slot of second 100
+        self._record_at(analytics, 250.0)   # more than a window later
+
+        with self._at(250.0):
+            assert analytics.get_request_frequency(1) == 1.0
+        with self._at(400.0):
+            assert analytics.get_request_frequency(1) == 0.0
+
+    def test_frequency_and_success_share_window_counts(self):
+        """Test that both statistics for the same window come from one count."""
+        analytics = RequestAnalytics()
+        self._record_at(analytics, 100.0)
+        self._record_at(analytics, 100.0, success=False)
+
+        with self._at(100.0), patch.object(analytics, '_window_counts',
+                                           wraps=analytics._window_counts) as counts:
+            assert analytics.get_request_frequency(5) == 2 / 5
+            assert analytics.get_success_rate(5) == 0.5
+            counts.assert_called_once_with(5)
+
+    def test_stats_reused_within_ttl(self):
+        """Test that frequency is not recomputed until stats_ttl has passed."""
+        analytics = RequestAnalytics()
+        self._record_at(analytics, 100.0)
+
+        with self._at(100.0):
+            assert analytics.get_request_frequency(5) == 1 / 5
+        self._record_at(analytics, 100.2)
+        with self._at(100.2):
+            assert analytics.get_request_frequency(5) == 1 / 5
+        with self._at(101.0):
+            assert analytics.get_request_frequency(5) == 2 / 5
+
+
+class TestStealthSession:
+    """Tests for StealthSession connection setup."""
+
+    def test_adapter_pool_sizes(self):
+        """Test that the session mounts a pooled adapter sized for concurrent use."""
+        from youtube_toolkit.utils.anti_detection import StealthSession
+        session = StealthSession()
+        adapter = session.session.get_adapter('https://www.youtube.com')
+
+        assert adapter._pool_connections == 32
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.respect_retry_after_header
+
+    def test_accept_encoding_matches_decoders(self):
+        """Test that only encodings urllib3 can decode are advertised."""
+        from urllib3.util.request import ACCEPT_ENCODING
+        from youtube_toolkit.utils.anti_detection import StealthSession
+        session = StealthSession()
+        advertised = session.session.headers['Accept-Encoding'].replace(' ', '').split(',')
+
+        assert set(advertised) == set(ACCEPT_ENCODING.split(','))
+
+    def test_rotate_user_agent_applies_full_header_set(self):
+        """Test that rotating swaps in a prebuilt header set for one of the user agents."""
+        from youtube_toolkit.utils.anti_detection import StealthSession
+        session = StealthSession()
+
+        with patch('youtube_toolkit.utils.anti_detection.random.randrange', return_value=3):
+            session.rotate_user_agent()
+
+        assert session.session.headers['User-Agent'] == session.user_agents[3]
+        assert session.current_user_agent == session.user_agents[3]
+        assert session.session.headers['Sec-Fetch-Mode'] == 'navigate'
+
+    def test_stealth_headers_snapshot_follows_rotation(self):
+        """Test that the shared header snapshot is reused and rebuilt on rotation."""
+        from youtube_toolkit.utils.anti_detection import AntiDetectionManager
+        manager = AntiDetectionManager()
+
+        first = manager.get_stealth_headers()
+        assert manager.get_stealth_headers() is first
+
+        with patch('youtube_toolkit.utils.anti_detection.random.randrange', return_value=2):
+            manager.stealth_session.rotate_user_agent()
+
+        headers = manager.get_stealth_headers()
+        assert headers['User-Agent'] == manager.stealth_session.user_agents[2]
+        copy = manager.get_stealth_headers_copy()
+        copy['X-Test'] = '1'
+        assert 'X-Test' not in manager.get_stealth_headers()
+
+
+class TestSafeRequestMany:
+    """Tests for batched safe requests."""
+
+    def test_results_in_order_with_failures_as_none(self):
+        """Test that responses keep input order and failed requests map to None."""
+        from youtube_toolkit.utils.anti_detection import AntiDetectionManager
+        manager = AntiDetectionManager()
+
+        def request(url, method='get', **kwargs):
+            if url.endswith('bad'):
+                raise RuntimeError('boom')
+            return url.upper()
+
+        with patch.object(manager, 'safe_request', side_effect=request):
+            results = manager.safe_request_many(['https://a', 'https://bad', 'https://c'])
+
+        assert results == ['HTTPS://A', None, 'HTTPS://C']
+
+    def test_safe_request_async(self):
+        """Test that safe_request_async awaits the synchronous request."""
+        import asyncio
+        from youtube_toolkit.utils.anti_detection import AntiDetectionManager
+        manager = AntiDetectionManager()
+
+        with patch.object(manager, 'safe_request', return_value='response') as mock:
+            assert asyncio.run(manager.safe_request_async('https://a', timeout=5)) == 'response'
+            mock.assert_called_once_with('https://a', 'get', timeout=5)
+
+
+class TestSafeRequest:
+    """Tests for AntiDetectionManager.safe_request."""
+
+    def test_records_current_user_agent(self):
+        """Test that the request is recorded with the session's current user agent."""
+        from unittest.mock import MagicMock
+        from youtube_toolkit.utils.anti_detection import AntiDetectionManager
+        manager = AntiDetectionManager()
+        response = MagicMock(status_code=200)
+
+        with patch.object(manager, 'apply_delay'), \
+             patch.object(manager, 'randomize_request_behavior'), \
+             patch.object(manager.stealth_session, 'get', return_value=response):
+            assert manager.safe_request('https://a') is response
+
+        record = manager.analytics.requests[-1]
+        assert record.user_agent == manager.stealth_session.current_user_agent
+        assert record.method == 'get'
+        assert manager.get_status()['current_user_agent'] == record.user_agent
+
+
+class TestRandomizedBehavior:
+    """Tests for delay and jitter randomization."""
+
+    def test_jitter_and_rotation_thresholds(self):
+        """Test that draws below the thresholds rotate and sleep 0.1-0.5s."""
+        from youtube_toolkit.utils.anti_detection import AntiDetectionManager
+        manager = AntiDetectionManager()
+
+        with patch('youtube_toolkit.utils.anti_detection._random', side_effect=[0.1, 0.2, 0.5]), \
+             patch.object(manager.stealth_session, 'rotate_user_agent') as rotate, \
+             patch('youtube_toolkit.utils.anti_detection.time.sleep') as sleep:
+            manager.randomize_request_behavior()
+
+        rotate.assert_called_once()
+        sleep.assert_called_once_with(0.1 + 0.4 * 0.5)
+
+    def test_base_delay_spans_min_to_max(self):
+        """Test that the base delay maps a draw onto [min_delay, max_delay]."""
+        from youtube_toolkit.utils.anti_detection import AntiDetectionManager
+        manager = AntiDetectionManager()
+        manager.last_request_time = time.monotonic()
+
+        with patch('youtube_toolkit.utils.anti_detection._random', return_value=0.5), \
+             patch('youtube_toolkit.utils.anti_detection.time.sleep') as sleep:
+            manager.apply_delay()
+
+        assert 2.9 < sleep.call_args[0][0] <= 3.0
+
+
+class TestStatus:
+    """Tests for AntiDetectionManager.get_status."""
+
+    def test_last_request_formatted_once_per_request(self):
+        """Test that the last request time is reported from the wall clock and reused."""
+        from datetime import datetime
+        from youtube_toolkit.utils.anti_detection import AntiDetectionManager
+        manager = AntiDetectionManager()
+        assert manager.get_status()['last_request'] == 'Never'
+
+        with patch('youtube_toolkit.utils.anti_detection.time.sleep'):
+            manager.apply_delay()
+        expected = datetime.fromtimestamp(manager.last_request_wallclock).isoformat()
+
+        with patch('youtube_toolkit.utils.anti_detection.datetime') as mock_datetime:
+            mock_datetime.fromtimestamp.side_effect = datetime.fromtimestamp
+            assert manager.get_status()['last_request'] == expected
+            assert manager.get_status()['last_request'] == expected
+        assert mock_datetime.fromtimestamp.call_count == 1
+
+
+class TestRateLimit:
+    """Tests for the rate_limit decorator."""
+
+    def test_waits_for_oldest_request_to_leave_window(self):
+        """Test that a full window sleeps until the oldest request expires."""
+        from youtube_toolkit.utils.request_interceptor import rate_limit
+
+        class Handler:
+            @rate_limit(max_requests=2, window_minutes=1)
+            def fetch(self):
+                return 'ok'
+
+        handler = Handler()
+        clock = iter([0.0, 10.0, 20.0, 60.0])
+        with patch('youtube_toolkit.utils.request_interceptor.time.monotonic', side_effect=lambda: next(clock)), \
+             patch('youtube_toolkit.utils.request_interceptor.time.sleep') as sleep:
+            assert handler.fetch() == 'ok'
+            assert handler.fetch() == 'ok'
+            assert handler.fetch() == 'ok'
+
+        sleep.assert_called_once_with(40.0)
+        assert list(Handler.fetch.__wrapped__._rate_limit_data['requests']) == [10.0, 60.0]
+
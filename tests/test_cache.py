@@ -0,0 +1,253 @@
+"""
+Tests for the metadata TTL cache and its use by the Get API.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from youtube_toolkit.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_and_set(self):
+        """Test that stored values are returned until cleared."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+        assert 'a' in cache
+        cache.clear()
+        assert cache.get('a') is None
+
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        with patch('youtube_toolkit.utils.cache.time.monotonic', return_value=100.0):
+            cache.set('a', 1)
+            cache.set('b', 2, ttl=5)
+        with patch('youtube_toolkit.utils.cache.time.monotonic', return_value=110.0):
+            assert cache.get('a') == 1
+            assert cache.get('b', 'gone') == 'gone'
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache stays within maxsize, evicting the LRU entry."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert len(cache) == 2
+        assert 'a' in cache
+        assert 'b' not in cache
+
+    def test_zero_size_disables(self):
+        """Test that maxsize=0 never stores anything."""
+        cache = TTLCache(maxsize=0)
+        cache.set('a', 1)
+        assert len(cache) == 0
+
+
+class TestGetAPICaching:
+    """Tests for cached get.video/channel/playlist lookups."""
+
+    def test_video_cached_across_url_forms(self):
+        """Test that the same video fetched via different URLs hits the network once."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_video_info') as mock:
+            mock.return_value = {'title': 'Test', 'video_id': 'dQw4w9WgXcQ'}
+
+            first = toolkit.get.video('https://www.youtube.com/watch?v=dQw4w9WgXcQ')
+            second = toolkit.get.video('https://youtu.be/dQw4w9WgXcQ')
+
+            assert mock.call_count == 1
+            assert second == first
+
+    def test_channel_and_playlist_cached(self):
+        """Test that channel and playlist info are fetched once per argument set."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_channel_info', return_value={'name': 'x'}) as channel, \
+             patch.object(toolkit.pytubefix, 'get_playlist_urls', return_value=['u1']) as urls:
+            toolkit.get.channel('@test')
+            toolkit.get.channel('@test')
+            toolkit.get.playlist.urls('https://youtube.com/playlist?list=PL1')
+            toolkit.get.playlist.urls('https://youtube.com/playlist?list=PL1')
+
+            assert channel.call_count == 1
+            assert urls.call_count == 1
+
+    def test_clear_forces_refetch(self):
+        """Test that toolkit.cache.clear() invalidates cached responses."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_channel_info', return_value={}) as mock:
+            toolkit.get.channel('@test')
+            toolkit.cache.clear()
+            toolkit.get.channel('@test')
+
+            assert mock.call_count == 2
+
+    def test_errors_not_cached(self):
+        """Test that a failed lookup is retried on the next call."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_playlist_info') as mock:
+            mock.side_effect = [RuntimeError('boom'), {'title': 'ok'}]
+
+            with pytest.raises(RuntimeError):
+                toolkit.get.playlist('https://youtube.com/playlist?list=PL1')
+            assert toolkit.get.playlist('https://youtube.com/playlist?list=PL1') == {'title': 'ok'}
+
+    def test_equivalent_call_spellings_share_entry(self):
+        """Test that positional, keyword and defaulted arguments map to one entry."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_channel_info', return_value={'title': 'C'}) as info, \
+             patch.object(toolkit.pytubefix, 'get_channel_videos', return_value=[]) as videos:
+            toolkit.get.channel('@x')
+            toolkit.get.channel(channel='@x')
+            toolkit.get.channel.videos('@x')
+            toolkit.get.channel.videos('@x', None)
+            toolkit.get.channel.videos('@x', limit=None, sort_by='newest')
+
+        assert info.call_count == 1
+        assert videos.call_count == 1
+
+    def test_mutating_fetched_result_does_not_leak(self):
+        """Test that the cache keeps its own copy of a freshly fetched value."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_video_info', return_value={'title': 'T'}), \
+             patch.object(toolkit.pytubefix, 'get_video_chapters', return_value=[{'title': 'Intro'}]):
+            info = toolkit.get.video('https://youtu.be/dQw4w9WgXcQ', include=['chapters'])
+            info.title = 'changed'
+            info.chapters.append({'title': 'extra'})
+
+            again = toolkit.get.video('https://youtu.be/dQw4w9WgXcQ', include=['chapters'])
+            assert again.title == 'T'
+            assert again.chapters == [{'title': 'Intro'}]
+
+    def test_cache_hits_share_stored_value(self):
+        """Test that cache hits return the stored value without copying it."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_playlist_urls', return_value=['a', 'b']):
+            toolkit.get.playlist.urls('https://youtube.com/playlist?list=PL1')
+            first = toolkit.get.playlist.urls('https://youtube.com/playlist?list=PL1')
+            second = toolkit.get.playlist.urls('https://youtube.com/playlist?list=PL1')
+
+        assert first is second
+
+
+class TestSingleFlight:
+    """Tests for in-flight request deduplication."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers arriving mid-flight wait for and share the result."""
+        import threading
+        from youtube_toolkit.utils.cache import SingleFlight
+
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'value'
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do('k', slow)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(flight.do('k', slow)))
+                     for _ in range(3)]
+        for t in followers:
+            t.start()
+        release.set()
+        for t in [leader] + followers:
+            t.join(5)
+
+        assert calls == [1]
+        assert results == ['value'] * 4
+
+    def test_errors_propagate_and_are_not_kept(self):
+        """Test that a failed flight raises for the caller and the next call reruns."""
+        from youtube_toolkit.utils.cache import SingleFlight
+
+        flight = SingleFlight()
+
+        with pytest.raises(RuntimeError):
+            flight.do('k', lambda: (_ for _ in ()).throw(RuntimeError('boom')))
+        assert flight.do('k', lambda: 'ok') == 'ok'
+
+    def test_get_video_concurrent_same_url_fetches_once(self):
+        """Test that parallel get.video calls for one video make a single request."""
+        import threading
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        gate = threading.Event()
+
+        def slow_info(url):
+            gate.wait(1)
+            return {'title': 'Test', 'video_id': 'dQw4w9WgXcQ'}
+
+        with patch.object(toolkit.pytubefix, 'get_video_info', side_effect=slow_info) as mock:
+            threads = [threading.Thread(target=toolkit.get.video,
+                                        args=('https://youtu.be/dQw4w9WgXcQ',))
+                       for _ in range(4)]
+            for t in threads:
+                t.start()
+            gate.set()
+            for t in threads:
+                t.join(5)
+
+        assert mock.call_count == 1
+
+
+class TestNegativeCaching:
+    """Tests for short-lived caching of empty results."""
+
+    def test_empty_results_use_negative_ttl(self):
+        """Test that empty results expire after negative_ttl, others after the cache TTL."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_video_chapters', return_value=[]) as chapters, \
+             patch.object(toolkit.pytubefix, 'get_replayed_heatmap', return_value=[{'start': 0}]) as heatmap:
+            with patch('youtube_toolkit.utils.cache.time.monotonic', return_value=100.0):
+                toolkit.get.chapters('https://youtu.be/dQw4w9WgXcQ')
+                toolkit.get.heatmap('https://youtu.be/dQw4w9WgXcQ')
+            with patch('youtube_toolkit.utils.cache.time.monotonic', return_value=200.0):
+                toolkit.get.chapters('https://www.youtube.com/watch?v=dQw4w9WgXcQ')
+                toolkit.get.heatmap('https://youtu.be/dQw4w9WgXcQ')
+                assert chapters.call_count == 1
+            with patch('youtube_toolkit.utils.cache.time.monotonic', return_value=500.0):
+                toolkit.get.chapters('https://youtu.be/dQw4w9WgXcQ')
+                toolkit.get.heatmap('https://youtu.be/dQw4w9WgXcQ')
+
+        assert chapters.call_count == 2
+        assert heatmap.call_count == 1
+
+    def test_video_extras_reuse_cached_lookups(self):
+        """Test that repeated get.video(include=...) calls do not refetch empty extras."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_video_info', return_value={'title': 'T'}), \
+             patch.object(toolkit.pytubefix, 'get_video_chapters', return_value=[]) as chapters:
+            toolkit.get.video('https://youtu.be/dQw4w9WgXcQ', include=['chapters'])
+            toolkit.get.chapters('https://youtu.be/dQw4w9WgXcQ')
+
+        assert chapters.call_count == 1
@@ -9,6 +9,8 @@ This tests the 5 core Sub-APIs:
 - StreamAPI
 """
 
+import os
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -142,6 +144,73 @@ class TestGetAPI:
         toolkit = YouTubeToolkit()
         assert hasattr(toolkit.get, 'embed_url')
 
+    def test_get_call_routes_by_url_kind(self):
+        """Test that get() dispatches playlist, channel and video URLs."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_playlist_info', return_value='playlist'), \
+             patch.object(toolkit.pytubefix, 'get_channel_info', return_value='channel'), \
+             patch.object(toolkit.pytubefix, 'get_video_info', return_value={'title': 'video'}):
+            assert toolkit.get('https://youtube.com/PLAYLIST?list=PL1') == 'playlist'
+            assert toolkit.get('https://youtube.com/watch?v=abc&list=PL1') == 'playlist'
+            assert toolkit.get('https://youtube.com/@Fireship/playlists?List=x') == 'playlist'
+            assert toolkit.get('https://youtube.com/@Fireship') == 'channel'
+            assert toolkit.get('https://youtube.com/Channel/UC123') == 'channel'
+            assert toolkit.get('@Fireship') == 'channel'
+            assert toolkit.get('https://youtube.com/watch?v=abc').title == 'video'
+
+    def test_get_video_include_extras(self):
+        """Test that include extras are fetched and failures fall back to defaults."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_video_info', return_value={'title': 'T'}), \
+             patch.object(toolkit.pytubefix, 'get_video_chapters', return_value=[{'title': 'Intro'}]), \
+             patch.object(toolkit.pytubefix, 'get_replayed_heatmap', side_effect=RuntimeError('x')), \
+             patch.object(toolkit.ytdlp, 'get_transcript', side_effect=RuntimeError('x')), \
+             patch.object(toolkit.ytdlp, 'get_lyrics') as lyrics:
+            info = toolkit.get.video(
+                'https://youtube.com/watch?v=abc123',
+                include=['chapters', 'heatmap', 'transcript']
+            )
+
+        assert info.chapters == [{'title': 'Intro'}]
+        assert info.heatmap == []
+        assert info.transcript is None
+        lyrics.assert_not_called()
+
+
+class TestAsyncGetAPI:
+    """Tests for the awaitable toolkit.aget facade."""
+
+    def test_aget_video_awaits_get_video(self):
+        """Test that aget.video returns the cached VideoInfo get.video returns."""
+        import asyncio
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_video_info', return_value={'title': 'T'}) as mock:
+            info = asyncio.run(toolkit.aget.video('https://youtu.be/dQw4w9WgXcQ'))
+            assert info.title == 'T'
+            assert toolkit.get.video('https://youtu.be/dQw4w9WgXcQ') == info
+            assert mock.call_count == 1
+
+    def test_aget_videos_keeps_order(self):
+        """Test that aget.videos fetches concurrently and preserves input order."""
+        import asyncio
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        urls = [f'https://youtu.be/video{i:06d}' for i in range(5)]
+
+        def info(url):
+            return {'title': url[-11:]}
+
+        with patch.object(toolkit.pytubefix, 'get_video_info', side_effect=info):
+            infos = asyncio.run(toolkit.aget.videos(urls))
+
+        assert [i.title for i in infos] == [u[-11:] for u in urls]
+
 
 class TestDownloadAPI:
     """Tests for DownloadAPI methods."""
@@ -329,6 +398,24 @@ class TestAnalyzeAPI:
         toolkit = YouTubeToolkit()
         assert hasattr(toolkit.analyze, 'filesize')
 
+    def test_analyze_results_cached_by_video(self):
+        """Test that sponsorblock and engagement reuse earlier lookups of the same video."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.yt_dlp, 'get_sponsorblock_segments',
+                          return_value=[{'category': 'sponsor'}]) as segments, \
+             patch.object(toolkit.pytubefix, 'get_replayed_heatmap', return_value=[{'start': 0}]) as heatmap, \
+             patch.object(toolkit.pytubefix, 'get_key_moments', return_value=[]):
+            toolkit.analyze.sponsorblock('https://youtu.be/dQw4w9WgXcQ')
+            toolkit.analyze.sponsorblock('https://www.youtube.com/watch?v=dQw4w9WgXcQ')
+            toolkit.get.heatmap('https://youtu.be/dQw4w9WgXcQ')
+            result = toolkit.analyze.engagement('https://youtu.be/dQw4w9WgXcQ')
+
+        assert segments.call_count == 1
+        assert heatmap.call_count == 1
+        assert result == {'heatmap': [{'start': 0}], 'key_moments': []}
+
 
 class TestStreamAPI:
     """Tests for StreamAPI methods."""
@@ -363,6 +450,67 @@ class TestStreamAPI:
         toolkit = YouTubeToolkit()
         assert hasattr(toolkit.stream.live, 'is_live')
 
+    def test_stream_live_status_returns_live_status(self):
+        """Test that stream.live.status returns a LiveStatus readable like the old dict."""
+        from youtube_toolkit import YouTubeToolkit, LiveStatus
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.yt_dlp, 'get_live_status') as mock:
+            mock.return_value = {
+                'is_live': True, 'was_live': False, 'live_status': 'is_live',
+                'release_timestamp': 1700000000, 'release_date': '20231114',
+                'availability': 'public',
+            }
+            status = toolkit.stream.live.status('https://youtu.be/dQw4w9WgXcQ')
+
+            assert isinstance(status, LiveStatus)
+            assert status.is_live is True
+            assert status['live_status'] == 'is_live'
+            assert status.get('missing', 'x') == 'x'
+            assert toolkit.stream.live.is_live('https://youtu.be/dQw4w9WgXcQ') is True
+            assert mock.call_count == 1
+
+    def test_stream_live_status_keeps_dict_access(self):
+        """Test that LiveStatus reads like the dict it replaces, even for partial handler data."""
+        import json
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.yt_dlp, 'get_live_status',
+                          return_value={'is_live': False, 'error': 'unavailable'}):
+            status = toolkit.stream.live.status('https://youtu.be/dQw4w9WgXcQ')
+
+        assert 'is_live' in status
+        assert 'error' not in status
+        assert status.live_status == 'not_live'
+        assert json.loads(json.dumps(status.to_dict()))['availability'] == ''
+        assert dict(**status) == dict(status) == status.to_dict()
+        with pytest.raises(KeyError):
+            status['error']
+        with pytest.raises(AttributeError):
+            status.is_live = True
+        assert not hasattr(status, '__dict__')
+        assert set(status.keys()) == {
+            'is_live', 'was_live', 'live_status', 'release_timestamp', 'release_date', 'availability'
+        }
+
+    def test_stream_live_batch_is_live(self):
+        """Test that batch_is_live maps each URL and treats failures as not live."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        def status(url):
+            if url.endswith('broken00000'):
+                raise RuntimeError('unavailable')
+            return {'is_live': url.endswith('live0000000')}
+
+        urls = ['https://youtu.be/live0000000', 'https://youtu.be/vod00000000',
+                'https://youtu.be/broken00000']
+        with patch.object(toolkit.yt_dlp, 'get_live_status', side_effect=status):
+            result = toolkit.stream.live.batch_is_live(urls)
+
+        assert result == {urls[0]: True, urls[1]: False, urls[2]: False}
+
 
 class TestLegacyAPIsRemoved:
     """Tests to verify legacy APIs have been removed in v1.0 consolidation."""
@@ -569,3 +717,296 @@ class TestMethodDelegation:
             result = toolkit.analyze.filesize('https://youtube.com/watch?v=test')
             assert result == {'best_audio': {'filesize_mb': 5.0}}
             mock.assert_called_once()
+
+
+class TestDownloadThumbnail:
+    """Tests for download.thumbnail quality fallback."""
+
+    def test_thumbnail_falls_back_without_downloading_maxres(self, tmp_path):
+        """Test that a missing maxres thumbnail is probed with HEAD, not GET."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        session = MagicMock()
+        session.head.return_value = MagicMock(status_code=404)
+        session.get.return_value = MagicMock(status_code=200)
+        session.get.return_value.iter_content.return_value = [b'jp', b'eg']
+
+        with patch.object(toolkit, 'extract_video_id', return_value='abc123'), \
+             patch('requests.Session', return_value=session):
+            path = toolkit.download.thumbnail(
+                'https://youtube.com/watch?v=abc123', output_path=str(tmp_path)
+            )
+
+        session.get.assert_called_once()
+        assert session.get.call_args[0][0].endswith('/abc123/hqdefault.jpg')
+        with open(path, 'rb') as f:
+            assert f.read() == b'jpeg'
+
+    def test_thumbnail_bypass_page_cache_writes_file(self, tmp_path):
+        """Test that bypass_page_cache still leaves the full file on disk."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=200)
+        session.get.return_value.iter_content.return_value = [b'jp', b'eg']
+
+        with patch.object(toolkit, 'extract_video_id', return_value='abc123'), \
+             patch('requests.Session', return_value=session):
+            path = toolkit.download.thumbnail(
+                'https://youtube.com/watch?v=abc123', output_path=str(tmp_path),
+                quality='high', bypass_page_cache=True
+            )
+
+        with open(path, 'rb') as f:
+            assert f.read() == b'jpeg'
+
+    def test_thumbnail_failed_transfer_keeps_existing_file(self, tmp_path):
+        """Test that a body failing midway leaves the old thumbnail intact and no partial file."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        existing = tmp_path / 'abc123_thumbnail.jpg'
+        existing.write_bytes(b'good')
+
+        def broken_body(chunk_size):
+            yield b'par'
+            raise ConnectionError('connection reset')
+
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=200, headers={}, iter_content=broken_body)
+
+        with patch.object(toolkit, 'extract_video_id', return_value='abc123'), \
+             patch('requests.Session', return_value=session):
+            with pytest.raises(ConnectionError):
+                toolkit.download.thumbnail(
+                    'https://youtube.com/watch?v=abc123', output_path=str(tmp_path), quality='high'
+                )
+
+        assert existing.read_bytes() == b'good'
+        assert os.listdir(tmp_path) == ['abc123_thumbnail.jpg']
+
+    def test_thumbnail_not_modified_keeps_existing_file(self, tmp_path):
+        """Test that a thumbnail we downloaded is revalidated with the server's validators."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        session = MagicMock()
+        session.get.side_effect = [
+            MagicMock(status_code=200, headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+                      iter_content=MagicMock(return_value=[b'old'])),
+            MagicMock(status_code=304, headers={}),
+        ]
+
+        with patch.object(toolkit, 'extract_video_id', return_value='abc123'), \
+             patch('requests.Session', return_value=session):
+            first = toolkit.download.thumbnail(
+                'https://youtube.com/watch?v=abc123', output_path=str(tmp_path), quality='high'
+            )
+            path = toolkit.download.thumbnail(
+                'https://youtube.com/watch?v=abc123', output_path=str(tmp_path), quality='high'
+            )
+
+        assert path == first
+        assert session.get.call_args_list[0][1]['headers'] == {}
+        assert session.get.call_args[1]['headers'] == {
+            'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+        assert session.get.call_args[1]['timeout']
+        with open(path, 'rb') as f:
+            assert f.read() == b'old'
+
+    def test_thumbnail_not_revalidated_across_qualities(self, tmp_path):
+        """Test that a file of another quality, or one we did not write, is downloaded again."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        (tmp_path / 'abc123_thumbnail.jpg').write_bytes(b'foreign')
+
+        session = MagicMock()
+        session.get.side_effect = lambda u, **kw: MagicMock(
+            status_code=200, headers={'ETag': u}, iter_content=MagicMock(return_value=[u.encode()])
+        )
+
+        with patch.object(toolkit, 'extract_video_id', return_value='abc123'), \
+             patch('requests.Session', return_value=session):
+            toolkit.download.thumbnail('https://youtu.be/abc123', output_path=str(tmp_path), quality='high')
+            path = toolkit.download.thumbnail('https://youtu.be/abc123', output_path=str(tmp_path),
+                                              quality='medium')
+
+        assert [c[1]['headers'] for c in session.get.call_args_list] == [{}, {}]
+        with open(path, 'rb') as f:
+            assert f.read().endswith(b'/abc123/mqdefault.jpg')
+
+    def test_thumbnails_batch_shares_session(self, tmp_path):
+        """Test that batch thumbnails reuse one session and keep input order."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        urls = [f'https://youtube.com/watch?v=vid{i}' for i in range(5)]
+
+        session = MagicMock()
+        session.get.side_effect = lambda u, **kw: (
+            MagicMock(status_code=404) if 'vid3' in u
+            else MagicMock(status_code=200, iter_content=MagicMock(return_value=[b'x']))
+        )
+
+        with patch.object(toolkit, 'extract_video_id', side_effect=lambda u: u.rsplit('=', 1)[-1]), \
+             patch('requests.Session', return_value=session) as mock_session:
+            paths = toolkit.download.thumbnails(urls, output_path=str(tmp_path), quality='high')
+            toolkit.download.thumbnail(urls[0], output_path=str(tmp_path), quality='high')
+
+        mock_session.assert_called_once()
+        assert session.get.call_count == 6
+        assert [p and os.path.basename(p) for p in paths] == [
+            'vid0_thumbnail.jpg', 'vid1_thumbnail.jpg', 'vid2_thumbnail.jpg',
+            None, 'vid4_thumbnail.jpg',
+        ]
+
+    def test_thumbnails_grows_pool_to_worker_count(self, tmp_path):
+        """Test that a wide batch remounts the pool so every worker keeps a connection."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        urls = [f'https://youtube.com/watch?v=vid{i}' for i in range(40)]
+
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=404)
+
+        with patch.object(toolkit, 'extract_video_id', side_effect=lambda u: u.rsplit('=', 1)[-1]), \
+             patch('requests.Session', return_value=session), \
+             patch('youtube_toolkit.sub_apis.HTTPAdapter') as adapter:
+            toolkit.download.thumbnails(urls, output_path=str(tmp_path), quality='high', max_workers=32)
+
+        sizes = [c.kwargs['pool_maxsize'] for c in adapter.call_args_list]
+        assert sizes == [16, 32]
+
+    def test_pool_only_grows_and_closes_replaced_adapter(self):
+        """Test that resizing closes the old adapter and a narrower batch keeps the wider pool."""
+        from youtube_toolkit import YouTubeToolkit
+        download = YouTubeToolkit().download
+        session = download._session
+        first = session.get_adapter('https://i.ytimg.com/')
+
+        with patch.object(first, 'close') as close:
+            download._grow_pool(32)
+            close.assert_called_once()
+
+        wide = session.get_adapter('https://i.ytimg.com/')
+        with patch.object(wide, 'close') as close:
+            download._grow_pool(8)
+            close.assert_not_called()
+
+        assert session.get_adapter('https://i.ytimg.com/') is wide
+        assert session.get_adapter('http://i.ytimg.com/') is wide
+        assert wide._pool_maxsize == 32
+
+
+class TestDownloadPlaylist:
+    """Tests for download.playlist batch downloads."""
+
+    def test_playlist_concurrent_download_keeps_order(self, tmp_path):
+        """Test that parallel playlist downloads report videos in playlist order."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        urls = [f'https://youtube.com/watch?v=vid{i}' for i in range(6)]
+
+        def fake_info(url):
+            return {'title': url.rsplit('=', 1)[-1], 'video_id': url.rsplit('=', 1)[-1]}
+
+        def fake_audio(url, format, output_path, bitrate):
+            open(output_path, 'wb').close()
+            return output_path
+
+        with patch.object(toolkit.youtube_api, 'get_playlist_info', return_value={'title': 'PL'}), \
+             patch.object(toolkit, 'get_playlist_urls', return_value=urls), \
+             patch.object(toolkit, 'get_video_info', side_effect=fake_info), \
+             patch.object(toolkit, 'download_audio', side_effect=fake_audio):
+            result = toolkit.download.playlist(
+                'https://youtube.com/playlist?list=PL', output_path=str(tmp_path), concurrency=3
+            )
+
+        videos = result['metadata']['videos']
+        assert [v['index'] for v in videos] == list(range(1, 7))
+        assert [v['video_id'] for v in videos] == [f'vid{i}' for i in range(6)]
+        assert result['metadata']['download_summary']['successful_downloads'] == 6
+
+    def test_playlist_same_titles_get_distinct_files(self, tmp_path):
+        """Test that entries with the same title are saved to different files."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+        urls = [f'https://youtube.com/watch?v=vid{i}' for i in range(4)]
+
+        def fake_info(url):
+            return {'title': 'Same Title', 'video_id': url.rsplit('=', 1)[-1]}
+
+        def fake_audio(url, format, output_path, bitrate):
+            open(output_path, 'wb').close()
+            return output_path
+
+        with patch.object(toolkit.youtube_api, 'get_playlist_info', return_value={'title': 'PL'}), \
+             patch.object(toolkit, 'get_playlist_urls', return_value=urls), \
+             patch.object(toolkit, 'get_video_info', side_effect=fake_info), \
+             patch.object(toolkit, 'download_audio', side_effect=fake_audio):
+            result = toolkit.download.playlist(
+                'https://youtube.com/playlist?list=PL', output_path=str(tmp_path), concurrency=4
+            )
+
+        files = [v['files']['audio'] for v in result['metadata']['videos']]
+        assert len(set(files)) == 4
+
+
+class TestPytubefixTempFiles:
+    """Tests for per-video temp file names in the pytubefix handler."""
+
+    def test_video_temp_files_named_per_video(self, tmp_path):
+        """Test that separate-stream downloads use temp names carrying the video ID."""
+        from youtube_toolkit import YouTubeToolkit
+        handler = YouTubeToolkit().pytubefix
+        yt = MagicMock(video_id='abc123XYZ_0', title='T')
+        video_stream = MagicMock(progressive=False, resolution='720p')
+        yt.streams.filter.return_value.order_by.return_value.desc.return_value.first.return_value = video_stream
+
+        with patch.object(handler, '_ensure_initialized'), \
+             patch.object(handler, '_create_yt', return_value=yt), \
+             patch('os.getcwd', return_value=str(tmp_path)):
+            try:
+                handler.download_video('https://youtu.be/abc123XYZ_0', output_path=str(tmp_path / 'out.mp4'),
+                                       progress_callback=False)
+            except Exception:
+                pass
+
+        names = [c.kwargs['filename'] for c in video_stream.download.call_args_list]
+        assert 'temp_video_abc123XYZ_0.mp4' in names
+        assert 'temp_audio_abc123XYZ_0.mp4' in names
+
+
+class TestChannelBulk:
+    """Tests for get.channel.bulk multi-tab fetches."""
+
+    def test_bulk_fetches_requested_tabs_and_fills_cache(self):
+        """Test that bulk returns each tab and later single-tab calls hit the cache."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        def fake_tab(channel, content_type='videos', limit=None, sort_by='newest'):
+            return [{'tab': content_type}]
+
+        with patch.object(toolkit.pytubefix, 'get_channel_videos', side_effect=fake_tab) as mock:
+            result = toolkit.get.channel.bulk('@test', tabs=['videos', 'shorts', 'playlists'])
+
+            assert result == {
+                'videos': [{'tab': 'videos'}],
+                'shorts': [{'tab': 'shorts'}],
+                'playlists': [{'tab': 'playlists'}],
+            }
+            assert mock.call_count == 3
+
+            assert toolkit.get.channel.videos('@test') == [{'tab': 'videos'}]
+            assert toolkit.get.channel.videos('@test', None) == [{'tab': 'videos'}]
+            assert mock.call_count == 3
+
+    def test_bulk_rejects_unknown_tab(self):
+        """Test that an unknown tab name raises ValueError."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        with pytest.raises(ValueError):
+            toolkit.get.channel.bulk('@test', tabs=['about'])
@@ -112,6 +112,25 @@ class TestDownloadAPI:
             assert result.success is True
             assert result.format == 'wav'
 
+    def test_download_accepts_media_type_enum(self):
+        """Test that download accepts MediaType members as well as strings."""
+        from youtube_toolkit import YouTubeToolkit, MediaType
+
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit, 'download_video') as mock:
+            mock.return_value = '/tmp/test.mp4'
+
+            result = toolkit.download(
+                'https://youtube.com/watch?v=abc123',
+                type=MediaType.VIDEO,
+                quality='720p'
+            )
+
+            assert result.success is True
+            assert result.format == 'mp4'
+            assert MediaType.AUDIO == 'audio'
+
     def test_download_video_returns_download_result(self):
         """Test that video download returns DownloadResult."""
         from youtube_toolkit import YouTubeToolkit, DownloadResult
@@ -247,6 +266,22 @@ class TestDownloadAPI:
             # For audio, quality field stores bitrate
             assert result.quality == '320k'
 
+    def test_download_dispatches_through_instance_methods(self):
+        """Test that download(type=...) goes through the instance's audio()/video()."""
+        from youtube_toolkit import YouTubeToolkit
+
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.download, 'audio', return_value='/tmp/a.mp3') as audio, \
+             patch.object(toolkit.download, 'video', return_value='/tmp/v.mp4') as video:
+            assert toolkit.download('https://youtube.com/watch?v=abc123', type='audio',
+                                    format='mp3').file_path == '/tmp/a.mp3'
+            assert toolkit.download('https://youtube.com/watch?v=abc123',
+                                    type='video').file_path == '/tmp/v.mp4'
+
+        audio.assert_called_once()
+        video.assert_called_once()
+
 
 class TestSearchAPI:
     """Tests for search() new API."""
@@ -273,6 +308,27 @@ class TestSearchAPI:
             assert result.query == 'test query'
             assert len(result.items) == 2
 
+    def test_search_converts_nested_api_items(self):
+        """Test that YouTube API style items (id/snippet) are flattened."""
+        from youtube_toolkit import YouTubeToolkit
+
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit, 'advanced_search') as mock:
+            mock.return_value = {
+                'items': [{
+                    'id': {'videoId': 'abc'},
+                    'snippet': {'title': 'Nested', 'channelTitle': 'Chan'},
+                }],
+            }
+
+            item = toolkit.search('test query').items[0]
+
+            assert item.video_id == 'abc'
+            assert item.title == 'Nested'
+            assert item.channel_title == 'Chan'
+            assert item.description == ''
+
     def test_search_with_filters(self):
         """Test search with SearchFilters."""
         from youtube_toolkit import YouTubeToolkit, SearchFilters
@@ -287,6 +343,131 @@ class TestSearchAPI:
 
             assert result.filters_applied is not None
 
+    def test_search_passes_through_typed_items(self):
+        """Test that SearchResultItem results from the backend are kept as-is."""
+        from youtube_toolkit import YouTubeToolkit
+        from youtube_toolkit.core.search import SearchResultItem
+
+        toolkit = YouTubeToolkit()
+        typed = [SearchResultItem(kind='youtube#video', etag='e', video_id=f'v{i}') for i in range(3)]
+
+        with patch.object(toolkit, 'advanced_search') as mock:
+            mock.return_value = {'items': typed}
+
+            result = toolkit.search('test')
+
+        assert [item.video_id for item in result.items] == ['v0', 'v1', 'v2']
+        assert result.items[0] is typed[0]
+
+    def test_search_paths_convert_items_alike(self):
+        """Test that the search sub-API and the legacy toolkit method build identical items."""
+        from youtube_toolkit import YouTubeToolkit
+
+        toolkit = YouTubeToolkit()
+        payload = {'items': [
+            {'video_id': 'abc', 'title': None, 'snippet': {'title': 'Nested', 'channelTitle': 'Chan'}},
+            {'id': {'videoId': 'def'}, 'snippet': {'description': 'D'}},
+        ]}
+
+        with patch.object(toolkit, 'advanced_search', return_value=payload):
+            via_sub_api = toolkit.search('test').items
+            via_toolkit = YouTubeToolkit.search(toolkit, 'test').items
+
+        assert via_sub_api == via_toolkit
+        assert via_sub_api[0].title is None
+        assert via_sub_api[0].channel_title == 'Chan'
+        assert via_sub_api[1].video_id == 'def'
+
+    def test_search_handles_mixed_item_types(self):
+        """Test that typed items and dicts in one result list are each handled."""
+        from youtube_toolkit import YouTubeToolkit
+        from youtube_toolkit.core.search import SearchResultItem
+
+        toolkit = YouTubeToolkit()
+        typed = SearchResultItem(kind='youtube#video', etag='e', video_id='v0')
+
+        with patch.object(toolkit, 'advanced_search') as mock:
+            mock.return_value = {'items': [typed, {'video_id': 'v1'}, None]}
+
+            result = toolkit.search('test')
+
+        assert result.items[0] is typed
+        assert [item.video_id for item in result.items] == ['v0', 'v1']
+
+    def test_search_caps_items_at_max_results(self):
+        """Test that extra backend items beyond max_results are not converted."""
+        from youtube_toolkit import YouTubeToolkit
+
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit, 'advanced_search') as mock:
+            mock.return_value = {'items': [{'video_id': f'v{i}'} for i in range(8)]}
+
+            result = toolkit.search('test', max_results=5)
+
+        assert [item.video_id for item in result.items] == ['v0', 'v1', 'v2', 'v3', 'v4']
+
+    def test_save_results_writes_json_lines(self, tmp_path):
+        """Test that save_results writes one JSON object per item."""
+        import json
+        from datetime import datetime
+        from youtube_toolkit import YouTubeToolkit, SearchResult
+        from youtube_toolkit.core.search import SearchResultItem
+
+        toolkit = YouTubeToolkit()
+        result = SearchResult(items=[
+            SearchResultItem(kind='youtube#video', etag='e1', video_id='abc',
+                             title='Ünïcode', published_at=datetime(2024, 1, 2)),
+            SearchResultItem(kind='youtube#video', etag='e2', video_id='def'),
+        ])
+        path = tmp_path / 'results.jsonl'
+
+        assert toolkit.search.save_results(str(path), result) == 2
+
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 2
+        first = json.loads(lines[0])
+        assert first['video_id'] == 'abc'
+        assert first['title'] == 'Ünïcode'
+        assert first['published_at'] == '2024-01-02T00:00:00'
+        assert json.loads(lines[1])['video_id'] == 'def'
+
+    def test_search_all_single_request(self):
+        """Test that search.all splits one mixed search and caches it."""
+        from youtube_toolkit import YouTubeToolkit
+
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'advanced_search') as mock:
+            mock.return_value = {
+                'videos': [{'video_id': 'abc'}],
+                'channels': [{'channel_id': 'UC1'}],
+                'playlists': [{'playlist_id': 'PL1'}],
+                'completion_suggestions': ['test music'],
+            }
+
+            result = toolkit.search.all('test', limit=5)
+            assert toolkit.search.all('test', limit=5) == result
+
+            mock.assert_called_once_with('test', result_type='all', max_results=5)
+            assert result['channels'] == [{'channel_id': 'UC1'}]
+            assert result['shorts'] == []
+            assert result['suggestions'] == ['test music']
+
+    def test_suggestions_cached_per_query(self):
+        """Test that repeated suggestion lookups for a query hit the network once."""
+        from youtube_toolkit import YouTubeToolkit
+
+        toolkit = YouTubeToolkit()
+
+        with patch.object(toolkit.pytubefix, 'get_search_suggestions',
+                          side_effect=lambda q: [q + ' tutorial']) as mock:
+            assert toolkit.search.suggestions('pyth') == ['pyth tutorial']
+            assert toolkit.search.suggestions('pyth') == ['pyth tutorial']
+            assert toolkit.search.suggestions('pytho') == ['pytho tutorial']
+
+            assert mock.call_count == 2
+
 
 class TestCommentsAPI:
     """Tests for comments() new API."""
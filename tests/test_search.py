@@ -91,6 +91,13 @@ class TestSearchResultItem:
         assert item.video_id == "abc123"
         assert item.title == "Test Video"
 
+    def test_uses_slots(self):
+        """Test SearchResultItem does not carry a per-instance __dict__."""
+        item = SearchResultItem(kind="youtube#video", etag="e", video_id="abc123")
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.unknown_field = 1
+
     def test_with_thumbnails(self):
         """Test SearchResultItem with thumbnails."""
         from youtube_toolkit.core.search import Thumbnails, Thumbnail
@@ -159,3 +159,256 @@ class TestSearchCategories:
         assert "Music" in categories
         assert "Gaming" in categories
         assert "Education" in categories
+
+
+class TestVideoIdCaching:
+    """Tests for memoized video ID extraction."""
+
+    def test_extract_video_id_is_memoized(self):
+        """Test that repeated lookups of the same URL are parsed once, module-wide."""
+        from youtube_toolkit import YouTubeToolkit
+        from youtube_toolkit.api import _parse_video_id
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=memo"
+
+        _parse_video_id.cache_clear()
+        for _ in range(3):
+            assert YouTubeToolkit().extract_video_id(url) == "dQw4w9WgXcQ"
+
+        info = _parse_video_id.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_standard_urls_skip_handlers(self):
+        """Test that common URL forms are parsed without calling a handler."""
+        from youtube_toolkit import YouTubeToolkit
+        toolkit = YouTubeToolkit()
+
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+            "https://youtu.be/dQw4w9WgXcQ?si=abc",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+            "https://www.youtube.com/embed/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        ]
+        with patch.object(toolkit.pytubefix, 'extract_video_id') as mock:
+            for url in urls:
+                assert toolkit.extract_video_id(url) == "dQw4w9WgXcQ"
+            mock.assert_not_called()
+
+
+class TestSharedYoutubeDL:
+    """Tests for reuse of yt-dlp instances in metadata lookups."""
+
+    def _handler(self):
+        from youtube_toolkit.handlers.yt_dlp_handler import YTDLPHandler
+        handler = YTDLPHandler()
+        handler._ydl = MagicMock()
+        handler._initialized = True
+        handler._ydl.YoutubeDL.return_value.extract_info.return_value = {'id': 'abc', 'is_live': True}
+        return handler
+
+    def test_metadata_lookups_reuse_instance(self):
+        """Test that repeated lookups with the same options build one YoutubeDL."""
+        handler = self._handler()
+
+        for _ in range(3):
+            assert handler.get_live_status("https://youtu.be/dQw4w9WgXcQ")['is_live'] is True
+        handler.test_connection("https://youtu.be/dQw4w9WgXcQ")
+
+        # One instance for get_live_status's options, one for test_connection's
+        assert handler._ydl.YoutubeDL.call_count == 2
+        handler._ydl.YoutubeDL.return_value.close.assert_not_called()
+
+    def test_instances_are_per_thread(self):
+        """Test that another thread gets its own YoutubeDL."""
+        import threading
+        handler = self._handler()
+
+        handler.get_live_status("https://youtu.be/dQw4w9WgXcQ")
+        t = threading.Thread(target=handler.get_live_status, args=("https://youtu.be/dQw4w9WgXcQ",))
+        t.start()
+        t.join(5)
+
+        assert handler._ydl.YoutubeDL.call_count == 2
+
+    def test_evicted_instances_are_closed(self):
+        """Test that instances pushed out of the per-thread cache are closed."""
+        handler = self._handler()
+        created = []
+        handler._ydl.YoutubeDL.side_effect = lambda opts: created.append(MagicMock()) or created[-1]
+
+        for n in range(handler._SHARED_YDL_MAX + 1):
+            with handler._shared_ydl({'quiet': True, 'n': n}):
+                pass
+
+        created[0].close.assert_called_once()
+        assert not any(ydl.close.called for ydl in created[1:])
+
+    def test_cookie_options_are_not_shared(self):
+        """Test that option sets carrying cookies get a fresh instance every time."""
+        handler = self._handler()
+
+        for _ in range(2):
+            with handler._shared_ydl({'quiet': True, 'cookiesfrombrowser': ('firefox',)}):
+                pass
+            with handler._shared_ydl({'quiet': True, 'cookiefile': 'cookies.txt'}):
+                pass
+
+        assert handler._ydl.YoutubeDL.call_count == 4
+
+    def test_close_closes_every_thread_instance(self):
+        """Test that close() closes instances made by all threads."""
+        import threading
+        handler = self._handler()
+        created = []
+        handler._ydl.YoutubeDL.side_effect = lambda opts: created.append(MagicMock()) or created[-1]
+        done = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            with handler._shared_ydl({'quiet': True}):
+                pass
+            done.set()
+            release.wait(5)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        done.wait(5)
+        with handler._shared_ydl({'quiet': True}):
+            pass
+        handler.close()
+        release.set()
+        t.join(5)
+
+        assert len(created) == 2
+        assert all(ydl.close.call_count == 1 for ydl in created)
+
+    def test_thread_exit_closes_its_instances(self):
+        """Test that a worker thread's instances are closed once the thread ends."""
+        import gc
+        import threading
+        handler = self._handler()
+
+        t = threading.Thread(target=handler.get_live_status, args=("https://youtu.be/dQw4w9WgXcQ",))
+        t.start()
+        t.join(5)
+        del t
+        gc.collect()
+
+        handler._ydl.YoutubeDL.return_value.close.assert_called_once()
+
+
+class _RangeServer:
+    """Stand-in for requests.Session serving one payload over HTTP ranges."""
+
+    def __init__(self, payload, headers=None, range_status=206, short_start=None):
+        self.payload = payload
+        self.headers = {'Accept-Ranges': 'bytes', 'Content-Length': str(len(payload))}
+        self.headers.update(headers or {})
+        self.headers = {k: v for k, v in self.headers.items() if v is not None}
+        self.range_status = range_status
+        self.short_start = short_start
+        self.ranges = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def head(self, url, **kwargs):
+        return MagicMock(status_code=200, url=url, headers=self.headers)
+
+    def get(self, url, headers=None, **kwargs):
+        start, end = (int(n) for n in headers['Range'][len('bytes='):].split('-'))
+        self.ranges.append((start, end))
+        body = self.payload if self.range_status == 200 else self.payload[start:end + 1]
+        if start == self.short_start:
+            body = body[:-1]
+        response = MagicMock(status_code=self.range_status)
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = lambda chunk_size: [
+            body[i:i + 7] for i in range(0, len(body), 7)
+        ]
+        return response
+
+
+class TestRangeDownload:
+    """Tests for parallel HTTP range downloads in the yt-dlp handler."""
+
+    URL = "https://youtu.be/dQw4w9WgXcQ"
+    PAYLOAD = bytes(range(256)) * 4 + b'tail'
+
+    def _handler(self):
+        from youtube_toolkit.handlers.yt_dlp_handler import YTDLPHandler
+        handler = YTDLPHandler()
+        handler._ydl = MagicMock()
+        handler._initialized = True
+        ydl = handler._ydl.YoutubeDL.return_value.__enter__.return_value
+        ydl.extract_info.return_value = {
+            'url': 'https://media.example/v.mp4', 'protocol': 'https', 'ext': 'mp4',
+        }
+        return handler, ydl
+
+    def _download(self, tmp_path, server):
+        handler, _ = self._handler()
+        with patch('requests.Session', return_value=server):
+            return handler._download_with_ranges(
+                self.URL, {}, str(tmp_path), 'dQw4w9WgXcQ', 4, progress_callback=False
+            )
+
+    @pytest.mark.skipif(not hasattr(os, 'pwrite'), reason="needs os.pwrite")
+    def test_parts_reassemble_byte_exact(self, tmp_path):
+        """Test that every range lands at its offset and the file matches the source."""
+        server = _RangeServer(self.PAYLOAD)
+
+        path = self._download(tmp_path, server)
+
+        assert path == os.path.join(str(tmp_path), 'dQw4w9WgXcQ.mp4')
+        with open(path, 'rb') as f:
+            assert f.read() == self.PAYLOAD
+        assert sorted(server.ranges) == [(0, 256), (257, 513), (514, 770), (771, 1027)]
+
+    @pytest.mark.skipif(not hasattr(os, 'pwrite'), reason="needs os.pwrite")
+    def test_full_response_to_range_request_falls_back(self, tmp_path):
+        """Test that a server ignoring Range (HTTP 200) falls back and leaves no file."""
+        assert self._download(tmp_path, _RangeServer(self.PAYLOAD, range_status=200)) is None
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.skipif(not hasattr(os, 'pwrite'), reason="needs os.pwrite")
+    def test_short_part_removes_file_and_falls_back(self, tmp_path):
+        """Test that a part ending early removes the preallocated file."""
+        assert self._download(tmp_path, _RangeServer(self.PAYLOAD, short_start=514)) is None
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.parametrize('headers', [
+        {'Accept-Ranges': None},
+        {'Accept-Ranges': 'none'},
+        {'Content-Length': None},
+        {'Content-Length': '0'},
+    ])
+    def test_no_range_support_falls_back(self, tmp_path, headers):
+        """Test that a missing Accept-Ranges or Content-Length skips the range path."""
+        server = _RangeServer(self.PAYLOAD, headers=headers)
+
+        assert self._download(tmp_path, server) is None
+        assert server.ranges == []
+        assert os.listdir(tmp_path) == []
+
+    def test_single_connection_skips_range_path(self, tmp_path):
+        """Test that connections=1 downloads through yt-dlp without range requests."""
+        handler, ydl = self._handler()
+        ydl.download.side_effect = lambda urls: (tmp_path / 'dQw4w9WgXcQ.mp4').write_bytes(b'ytdlp')
+
+        with patch('requests.Session') as session, \
+             patch.object(handler, '_download_with_ranges') as ranges:
+            path = handler.download_video(self.URL, str(tmp_path), progress_callback=False,
+                                          connections=1)
+
+        ranges.assert_not_called()
+        session.assert_not_called()
+        ydl.extract_info.assert_not_called()
+        ydl.download.assert_called_once()
+        assert path == os.path.join(str(tmp_path), 'dQw4w9WgXcQ.mp4')
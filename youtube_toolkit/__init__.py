@@ -48,14 +48,14 @@ __author__ = "Bo-Yu Chen"
 __description__ = "A comprehensive YouTube information and download toolkit"
 
 # Convenience imports for common use cases
-from .core import VideoInfo, DownloadResult, SearchResult, PostProcessorFactory
+from .core import VideoInfo, DownloadResult, MediaType, LiveStatus, SearchResult, PostProcessorFactory
 from .core.search import SearchFilters, SearchResultItem, Thumbnails, Thumbnail, BooleanSearchQuery, YOUTUBE_CATEGORIES
 from .core.comments import CommentFilters, CommentResult, Comment, CommentAuthor, CommentMetrics, CommentAnalytics, CommentSentimentAnalyzer, CommentOrder
 from .core.captions import CaptionFilters, CaptionResult, CaptionTrack, CaptionContent, CaptionCue, CaptionAnalytics, CaptionFormatConverter, CaptionAnalyzer
 
 # Make core classes available at package level for convenience
 __all__.extend([
-    "VideoInfo", "DownloadResult", "SearchResult", "PostProcessorFactory",
+    "VideoInfo", "DownloadResult", "MediaType", "LiveStatus", "SearchResult", "PostProcessorFactory",
     "SearchFilters", "SearchResultItem", "Thumbnails", "Thumbnail",
     "BooleanSearchQuery", "YOUTUBE_CATEGORIES",
     "CommentFilters", "CommentResult", "Comment", "CommentAuthor",
@@ -10,16 +10,32 @@ from .handlers.pytubefix_handler import PyTubeFixHandler
 from .handlers.yt_dlp_handler import YTDLPHandler
 from .handlers.youtube_api_handler import YouTubeAPIHandler
 from .utils.anti_detection import AntiDetectionManager
+from .utils.cache import TTLCache, SingleFlight
 from .core.video_info import VideoInfo
 from .core.download import DownloadResult
-from .core.search import SearchResult, SearchFilters, SearchResultItem
+from .core.search import SearchResult, SearchFilters, SearchResultItem, _EMPTY
 from .core.comments import CommentResult, CommentFilters, Comment, CommentAuthor, CommentMetrics, CommentOrder
 from .core.captions import CaptionResult, CaptionFilters, CaptionTrack
+import functools
 import os
+import re
 import time
 import warnings
 
 
+# 11-character video ID following watch?v=, youtu.be/, /shorts/, /embed/, /live/ or /v/
+_VIDEO_ID_RE = re.compile(
+    r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/|/v/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_video_id(url: str) -> Optional[str]:
+    """Pull the video ID out of a standard YouTube URL without any handler, or None."""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
 class YouTubeToolkit:
     """
     Main YouTube Toolkit class that combines multiple backends.
@@ -37,6 +53,7 @@ class YouTubeToolkit:
         toolkit.get.chapters(url)                 # Video chapters
         toolkit.get.formats(url)                  # Available formats
         toolkit.get.restriction(url)              # Age/region restrictions
+        await toolkit.aget.video(url)             # Same lookups, awaitable
 
         # DOWNLOAD - Save to disk
         toolkit.download(url)                     # Audio (default)
@@ -65,15 +82,25 @@ class YouTubeToolkit:
         toolkit.stream.live.status(url)           # Live stream status
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False,
+                 cache_size: int = 2048,
+                 cache_ttl: float = 1800):
         """
         Initialize the YouTube Toolkit.
 
         Args:
             verbose: Whether to show detailed progress information
+            cache_size: Max metadata responses kept in memory (0 disables caching)
+            cache_ttl: Seconds a cached metadata response stays valid
         """
         self.verbose = verbose
 
+        # Read-through cache for get.video/channel/playlist metadata;
+        # call toolkit.cache.clear() to force fresh fetches
+        self.cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # Concurrent identical lookups (e.g. from a web server) share one request
+        self.inflight = SingleFlight()
+
         # Create ONE anti-detection manager
         self.anti_detection = AntiDetectionManager()
 
@@ -92,6 +119,10 @@ class YouTubeToolkit:
         self.search = SearchAPI(self)
         self.analyze = AnalyzeAPI(self)
         self.stream = StreamAPI(self)
+
+        # Awaitable mirror of self.get for asyncio applications
+        from .async_api import AsyncGetAPI
+        self.aget = AsyncGetAPI(self)
     
     def get_video_info(self, url: str) -> Dict[str, Any]:
         """
@@ -184,7 +215,7 @@ class YouTubeToolkit:
     
     def download_video(self, url: str, quality: str = 'best',
                        progress_callback: bool = True, prefer_yt_dlp: bool = True,
-                       output_path: str = None) -> str:
+                       output_path: str = None, connections: int = 1) -> str:
         """
         Download video with automatic fallback.
 
@@ -196,6 +227,8 @@ class YouTubeToolkit:
             output_path: Custom output path for the video file. If None, uses default location.
                          For pytubefix: full file path including filename
                          For yt-dlp: directory path (filename auto-generated)
+            connections: Parallel HTTP range connections for yt-dlp single-file
+                         formats (1 = single connection)
 
         Returns:
             Path to downloaded video file
@@ -235,7 +268,7 @@ class YouTubeToolkit:
             try:
                 if self.verbose:
                     print("🎯 Trying YT-DLP first...")
-                return self.yt_dlp.download_video(video_id, output_path=ytdlp_path, quality=quality, progress_callback=effective_progress)
+                return self.yt_dlp.download_video(video_id, output_path=ytdlp_path, quality=quality, progress_callback=effective_progress, connections=connections)
             except Exception as e:
                 if self.verbose:
                     print(f"YT-DLP video download failed: {e}")
@@ -253,7 +286,7 @@ class YouTubeToolkit:
                     print(f"PyTubeFix video download failed: {e}")
                     print("🔄 Falling back to YT-DLP...")
                 # Fallback to yt-dlp
-                return self.yt_dlp.download_video(video_id, output_path=ytdlp_path, quality=quality, progress_callback=effective_progress)
+                return self.yt_dlp.download_video(video_id, output_path=ytdlp_path, quality=quality, progress_callback=effective_progress, connections=connections)
     
     def get_available_formats(self, url: str) -> Dict[str, Any]:
         """
@@ -292,6 +325,11 @@ class YouTubeToolkit:
         Returns:
             Video ID string
         """
+        # Common URL forms are parsed directly, no handler round-trip needed
+        video_id = _parse_video_id(url)
+        if video_id:
+            return video_id
+
         # Try pytubefix method first
         try:
             return self.pytubefix.extract_video_id(url)
@@ -555,15 +593,17 @@ class YouTubeToolkit:
                 
                 # Write comment data
                 for comment in comments:
+                    author = comment.get('author') or _EMPTY
+                    metrics = comment.get('metrics') or _EMPTY
                     writer.writerow([
                         comment.get('comment_id', ''),
                         comment.get('text', ''),
-                        comment.get('author', {}).get('display_name', ''),
+                        author.get('display_name', ''),
                         comment.get('published_at', ''),
-                        comment.get('metrics', {}).get('like_count', 0),
-                        comment.get('metrics', {}).get('reply_count', 0),
-                        comment.get('author', {}).get('channel_id', ''),
-                        comment.get('author', {}).get('is_verified', False),
+                        metrics.get('like_count', 0),
+                        metrics.get('reply_count', 0),
+                        author.get('channel_id', ''),
+                        author.get('is_verified', False),
                         comment.get('parent_id', '')
                     ])
         
@@ -1257,9 +1297,9 @@ class YouTubeToolkit:
             
             # Test PyTubeFix
             print("  Testing PyTubeFix...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             info = self.pytubefix.get_video_info(url)
-            pytubefix_time = time.time() - start_time
+            pytubefix_time = time.perf_counter() - start_time
             results['pytubefix'] = {
                 'success': info is not None,
                 'time_taken': pytubefix_time,
@@ -1268,9 +1308,9 @@ class YouTubeToolkit:
             
             # Test YT-DLP
             print("  Testing YT-DLP...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             info = self.yt_dlp.get_video_info(url)
-            ytdlp_time = time.time() - start_time
+            ytdlp_time = time.perf_counter() - start_time
             results['yt_dlp'] = {
                 'success': info is not None,
                 'time_taken': ytdlp_time,
@@ -1279,9 +1319,9 @@ class YouTubeToolkit:
             
             # Test YouTube API
             print("  Testing YouTube API...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             metadata = self.youtube_api.fetch_metadata(url)
-            api_time = time.time() - start_time
+            api_time = time.perf_counter() - start_time
             results['youtube_api'] = {
                 'success': 'error' not in metadata,
                 'time_taken': api_time,
@@ -1400,7 +1440,8 @@ class YouTubeToolkit:
     
     def download_playlist_media(self, playlist_url: str, media_type: str = 'audio', 
                                format: str = 'wav', quality: str = 'best',
-                               include_captions: bool = False, audio_bitrate: str = '128k') -> Dict[str, Any]:
+                               include_captions: bool = False, audio_bitrate: str = '128k',
+                               output_path: str = None, concurrency: int = 1) -> Dict[str, Any]:
         """
         Download media from all videos in playlist.
         
@@ -1411,30 +1452,37 @@ class YouTubeToolkit:
             quality: Video quality (only used if media_type='video')
             include_captions: Whether to download captions for each video
             audio_bitrate: Audio bitrate ('best', '320k', '256k', '192k', '128k', '96k', '64k') - only used if media_type='audio'
+            output_path: Base directory for the playlist folder (default: ./playlist_downloads)
+            concurrency: Number of videos to download in parallel (1 = one at a time)
             
         Returns:
             Dictionary with results summary
         """
         import json
         import os
+        import threading
         import time
+        from concurrent.futures import ThreadPoolExecutor
         from datetime import datetime
         
-        # Get playlist info and URLs
-        try:
-            playlist_info = self.youtube_api.get_playlist_info(playlist_url)
-        except:
-            playlist_info = {
-                'title': 'YouTube Playlist',
-                'description': 'Playlist downloaded with YouTube Toolkit'
-            }
+        # Get playlist info and URLs (independent requests, so fetch both at once)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            info_future = executor.submit(self.youtube_api.get_playlist_info, playlist_url)
+            urls_future = executor.submit(self.get_playlist_urls, playlist_url)
+            try:
+                playlist_info = info_future.result()
+            except:
+                playlist_info = {
+                    'title': 'YouTube Playlist',
+                    'description': 'Playlist downloaded with YouTube Toolkit'
+                }
+            urls = urls_future.result()
         
-        urls = self.get_playlist_urls(playlist_url)
         if not urls:
             return {'success': False, 'error': 'No videos found in playlist'}
         
         # Create folder structure
-        base_dir = os.path.join(os.getcwd(), 'playlist_downloads')
+        base_dir = output_path or os.path.join(os.getcwd(), 'playlist_downloads')
         playlist_dir = os.path.join(base_dir, self._sanitize_filename(playlist_info['title']))
         
         folders = {
@@ -1473,16 +1521,26 @@ class YouTubeToolkit:
             }
         }
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # Download each video
-        for i, url in enumerate(urls, 1):
+        # File names already taken by an entry, so entries whose titles
+        # sanitize to the same name do not write (or race on) the same file
+        claimed_titles = set()
+        claimed_lock = threading.Lock()
+        
+        def download_one(i: int, url: str) -> Dict[str, Any]:
+            """Download a single playlist entry and return its metadata."""
             try:
                 print(f"📥 [{i}/{len(urls)}] Processing...")
                 
                 # Get video info
                 video_info = self.get_video_info(url)
                 video_title = self._sanitize_filename(video_info['title'])
+                with claimed_lock:
+                    if video_title in claimed_titles:
+                        video_id = video_info.get('video_id') or self.extract_video_id(url) or str(i)
+                        video_title = f"{video_title}_{video_id}"
+                    claimed_titles.add(video_title)
                 
                 # Download main media
                 if media_type == 'audio':
@@ -1530,10 +1588,8 @@ class YouTubeToolkit:
                     'error': None
                 }
                 
-                metadata['videos'].append(video_metadata)
-                metadata['download_summary']['successful_downloads'] += 1
-                
                 print(f"✅ Downloaded: {video_title}")
+                return video_metadata
                 
             except Exception as e:
                 error_msg = f"Video {i} failed: {e}"
@@ -1553,11 +1609,25 @@ class YouTubeToolkit:
                     'error': str(e)
                 }
                 
-                metadata['videos'].append(video_metadata)
+                return video_metadata
+        
+        # Download each video (network-bound, so worker threads overlap well)
+        indices = range(1, len(urls) + 1)
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(download_one, indices, urls))
+        else:
+            results = [download_one(i, url) for i, url in zip(indices, urls)]
+
+        for video_metadata in results:
+            metadata['videos'].append(video_metadata)
+            if video_metadata['download_status'] == 'success':
+                metadata['download_summary']['successful_downloads'] += 1
+            else:
                 metadata['download_summary']['failed_downloads'] += 1
         
         # Calculate final statistics
-        end_time = time.time()
+        end_time = time.perf_counter()
         metadata['download_summary']['download_time_seconds'] = end_time - start_time
         
         # Calculate total size
@@ -1565,8 +1635,12 @@ class YouTubeToolkit:
         for video in metadata['videos']:
             if video['download_status'] == 'success':
                 for file_path in video['files'].values():
-                    if file_path and os.path.exists(os.path.join(playlist_dir, file_path)):
-                        total_size += os.path.getsize(os.path.join(playlist_dir, file_path))
+                    if not file_path:
+                        continue
+                    try:
+                        total_size += os.stat(os.path.join(playlist_dir, file_path)).st_size
+                    except OSError:
+                        pass
         
         metadata['download_summary']['total_size_mb'] = round(total_size / (1024 * 1024), 2)
         
@@ -1943,7 +2017,7 @@ class YouTubeToolkit:
             >>> if result.success:
             ...     print(f"Downloaded to {result.file_path}")
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         backend_used = None
 
         try:
@@ -1971,12 +2045,13 @@ class YouTubeToolkit:
             else:
                 raise ValueError(f"Invalid type: {type}. Must be 'audio' or 'video'")
 
-            download_time = time.time() - start_time
+            download_time = time.perf_counter() - start_time
 
-            # Get file size if file exists
-            file_size = None
-            if os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
+            # Get file size if file exists (one stat instead of exists + getsize)
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError:
+                file_size = None
 
             return DownloadResult(
                 file_path=file_path,
@@ -1989,7 +2064,7 @@ class YouTubeToolkit:
             )
 
         except Exception as e:
-            download_time = time.time() - start_time
+            download_time = time.perf_counter() - start_time
             return DownloadResult(
                 file_path=output_path or '',
                 success=False,
@@ -2043,14 +2118,7 @@ class YouTubeToolkit:
             if isinstance(item, SearchResultItem):
                 items.append(item)
             elif isinstance(item, dict):
-                items.append(SearchResultItem(
-                    kind=item.get('kind', 'youtube#video'),
-                    etag=item.get('etag', ''),
-                    video_id=item.get('video_id', item.get('id', {}).get('videoId', '')),
-                    title=item.get('title', item.get('snippet', {}).get('title', '')),
-                    description=item.get('description', item.get('snippet', {}).get('description', '')),
-                    channel_title=item.get('channel_title', item.get('snippet', {}).get('channelTitle', '')),
-                ))
+                items.append(SearchResultItem.from_backend(item))
 
         return SearchResult(
             items=items,
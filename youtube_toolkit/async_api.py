@@ -0,0 +1,144 @@
+"""
+Async façade over the GET API.
+
+Lets asyncio applications (FastAPI, aiohttp, ...) await metadata lookups
+without wrapping every call in asyncio.to_thread themselves:
+
+    toolkit = YouTubeToolkit()
+    info = await toolkit.aget.video(url)
+    infos = await toolkit.aget.videos([url1, url2, url3])
+
+The handlers are synchronous, so calls run on a dedicated bounded thread pool
+shared by the toolkit instance. They go through toolkit.get, so results are
+served from and stored in the same cache, and concurrent identical lookups
+(from sync or async callers) are still fetched once.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, TYPE_CHECKING
+
+from .core.video_info import VideoInfo
+
+if TYPE_CHECKING:
+    from .api import YouTubeToolkit
+
+
+class AsyncGetAPI:
+    """
+    Awaitable mirror of GetAPI.
+
+    Usage:
+        await toolkit.aget(url)                   # Smart auto-detect
+        await toolkit.aget.video(url)             # Video info
+        await toolkit.aget.videos(urls)           # Many videos concurrently
+        await toolkit.aget.channel("@Fireship")   # Channel info
+        await toolkit.aget.playlist(url)          # Playlist info
+        await toolkit.aget.comments(url)          # Video comments
+    """
+
+    def __init__(self, toolkit: 'YouTubeToolkit', max_workers: int = 32):
+        """
+        Args:
+            toolkit: YouTubeToolkit instance whose get API is wrapped
+            max_workers: Upper bound on lookups running at the same time
+        """
+        self._toolkit = toolkit
+        self._max_workers = max_workers
+
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool running the blocking lookups (created on first use)."""
+        return ThreadPoolExecutor(max_workers=self._max_workers,
+                                  thread_name_prefix='youtube-toolkit-aget')
+
+    async def _run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def __call__(self, url: str,
+                       include: Optional[List[str]] = None) -> Union[VideoInfo, Dict[str, Any]]:
+        """Async toolkit.get(url) - auto-detect URL type and return its info."""
+        return await self._run(self._toolkit.get, url, include=include)
+
+    async def video(self, url: str,
+                    include: Optional[List[str]] = None) -> VideoInfo:
+        """Async toolkit.get.video()."""
+        return await self._run(self._toolkit.get.video, url, include=include)
+
+    async def videos(self, urls: Iterable[str],
+                     include: Optional[List[str]] = None,
+                     return_exceptions: bool = False) -> List[Union[VideoInfo, BaseException]]:
+        """
+        Get info for many videos concurrently.
+
+        Args:
+            urls: Video URLs
+            include: Extra data to include for every video
+            return_exceptions: Return failures in place instead of raising the first one
+
+        Returns:
+            List of VideoInfo in the same order as urls
+        """
+        return await asyncio.gather(*(self.video(url, include=include) for url in urls),
+                                    return_exceptions=return_exceptions)
+
+    async def channel(self, channel: str) -> Dict[str, Any]:
+        """Async toolkit.get.channel()."""
+        return await self._run(self._toolkit.get.channel, channel)
+
+    async def playlist(self, url: str) -> Dict[str, Any]:
+        """Async toolkit.get.playlist()."""
+        return await self._run(self._toolkit.get.playlist, url)
+
+    async def comments(self, url: str, limit: int = 100,
+                       order: str = 'relevance') -> Dict[str, Any]:
+        """Async toolkit.get.comments()."""
+        return await self._run(self._toolkit.get.comments, url, limit=limit, order=order)
+
+    async def chapters(self, url: str) -> List[Dict[str, Any]]:
+        """Async toolkit.get.chapters()."""
+        return await self._run(self._toolkit.get.chapters, url)
+
+    async def key_moments(self, url: str) -> List[Dict[str, Any]]:
+        """Async toolkit.get.key_moments()."""
+        return await self._run(self._toolkit.get.key_moments, url)
+
+    async def heatmap(self, url: str) -> List[Dict[str, Any]]:
+        """Async toolkit.get.heatmap()."""
+        return await self._run(self._toolkit.get.heatmap, url)
+
+    async def transcript(self, url: str, lang: str = 'en') -> Optional[str]:
+        """Async toolkit.get.transcript()."""
+        return await self._run(self._toolkit.get.transcript, url, lang)
+
+    async def lyrics(self, url: str) -> Optional[str]:
+        """Async toolkit.get.lyrics()."""
+        return await self._run(self._toolkit.get.lyrics, url)
+
+    async def captions(self, url: str) -> Dict[str, Any]:
+        """Async toolkit.get.captions()."""
+        return await self._run(self._toolkit.get.captions, url)
+
+    async def metadata(self, url: str) -> Dict[str, Any]:
+        """Async toolkit.get.metadata()."""
+        return await self._run(self._toolkit.get.metadata, url)
+
+    async def keywords(self, url: str) -> List[str]:
+        """Async toolkit.get.keywords()."""
+        return await self._run(self._toolkit.get.keywords, url)
+
+    async def formats(self, url: str) -> Dict[str, Any]:
+        """Async toolkit.get.formats()."""
+        return await self._run(self._toolkit.get.formats, url)
+
+    async def restriction(self, url: str) -> Dict[str, Any]:
+        """Async toolkit.get.restriction()."""
+        return await self._run(self._toolkit.get.restriction, url)
+
+    async def embed_url(self, url: str) -> str:
+        """Async toolkit.get.embed_url()."""
+        return await self._run(self._toolkit.get.embed_url, url)
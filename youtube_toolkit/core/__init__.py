@@ -5,8 +5,9 @@ This module contains the core data structures and post-processors used throughou
 """
 
 from .video_info import VideoInfo
-from .download import DownloadResult
+from .download import DownloadResult, MediaType
 from .search import SearchResult
+from .live import LiveStatus
 from .post_processors import (
     BasePostProcessor,
     PyTubeFixPostProcessor,
@@ -18,7 +19,9 @@ from .post_processors import (
 __all__ = [
     "VideoInfo",
     "DownloadResult",
+    "MediaType",
     "SearchResult",
+    "LiveStatus",
     "BasePostProcessor",
     "PyTubeFixPostProcessor", 
     "YTDLPPostProcessor",
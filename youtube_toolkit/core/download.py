@@ -3,13 +3,29 @@ Core DownloadResult dataclass for standardized download results.
 """
 
 from dataclasses import dataclass
+from enum import Enum
 from typing import Optional
 from pathlib import Path
 
 
+class MediaType(str, Enum):
+    """Media type accepted by download(type=...).
+
+    A str subclass, so MediaType.AUDIO == 'audio' and either form works
+    wherever a type string is accepted.
+    """
+    AUDIO = "audio"
+    VIDEO = "video"
+
+
 @dataclass
 class DownloadResult:
-    """Standardized download result structure."""
+    """Standardized download result structure.
+
+    download_time is an elapsed duration in seconds measured with a monotonic
+    clock (time.perf_counter), so it is never negative or skewed by
+    wall-clock adjustments.
+    """
     
     file_path: str
     success: bool = True
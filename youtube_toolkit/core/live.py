@@ -0,0 +1,58 @@
+"""
+Core LiveStatus dataclass for live stream state.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class LiveStatus:
+    """
+    Live stream state of a video.
+
+    A compact, immutable record. For callers written against the old dict
+    it also supports status['is_live'], status.get(...), 'is_live' in status
+    and dict(status); use to_dict() to serialize it.
+    """
+    is_live: bool = False
+    was_live: bool = False
+    live_status: str = 'not_live'
+    release_timestamp: Optional[int] = None
+    release_date: Optional[str] = None
+    availability: str = ''
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LiveStatus':
+        """Create LiveStatus from a handler's live status dictionary."""
+        return cls(
+            is_live=data.get('is_live', False),
+            was_live=data.get('was_live', False),
+            live_status=data.get('live_status', 'not_live'),
+            release_timestamp=data.get('release_timestamp'),
+            release_date=data.get('release_date'),
+            availability=data.get('availability', ''),
+        )
+
+    def keys(self):
+        """Field names, so dict(status) and **status keep working."""
+        return _KEYS
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup returning default for unknown keys."""
+        return getattr(self, key) if key in _KEYS else default
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dictionary."""
+        return {name: getattr(self, name) for name in _KEYS}
+
+
+_KEYS = tuple(f.name for f in fields(LiveStatus))
@@ -4,12 +4,18 @@ Enhanced to support YouTube API v3 structure with thumbnails, live content, and
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Mapping, Union
 from datetime import datetime
 import urllib.parse
+from types import MappingProxyType
 from .video_info import VideoInfo
 
 
+# Shared fallback for missing nested dicts (avoids a throwaway {} per lookup).
+# A read-only view, so a stray write through a lookup result can't corrupt it.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 class BooleanSearchQuery:
     """Helper class for building Boolean search queries with NOT (-) and OR (|) operators."""
     
@@ -153,9 +159,13 @@ class Thumbnails:
         return closest
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultItem:
-    """Individual search result item matching YouTube API structure."""
+    """Individual search result item matching YouTube API structure.
+
+    Uses __slots__ since searches build many of these; use
+    dataclasses.asdict() rather than vars() to serialize one.
+    """
     kind: str  # youtube#video, youtube#channel, youtube#playlist
     etag: str
     video_id: Optional[str] = None
@@ -168,6 +178,24 @@ class SearchResultItem:
     thumbnails: Optional[Thumbnails] = None
     live_broadcast_content: str = "none"  # none, upcoming, live
     
+    @classmethod
+    def from_backend(cls, item: Dict[str, Any]) -> 'SearchResultItem':
+        """
+        Create a SearchResultItem from a search backend dict.
+
+        Flat keys (video_id, title, ...) win when present; otherwise the
+        nested YouTube API layout (id.videoId, snippet.*) is used.
+        """
+        snippet = item.get('snippet', _EMPTY)
+        return cls(
+            kind=item.get('kind', 'youtube#video'),
+            etag=item.get('etag', ''),
+            video_id=item.get('video_id', item.get('id', _EMPTY).get('videoId', '')),
+            title=item.get('title', snippet.get('title', '')),
+            description=item.get('description', snippet.get('description', '')),
+            channel_title=item.get('channel_title', snippet.get('channelTitle', '')),
+        )
+    
     @property
     def is_live(self) -> bool:
         """Check if this is live content."""
@@ -111,8 +111,9 @@ class PyTubeFixHandler:
             out_dir, filename = os.path.split(output_path)
             os.makedirs(out_dir, exist_ok=True)  # Ensure directory exists
 
-            # Download to temporary file first
-            temp_filename = f"temp_{filename}"
+            # Download to temporary file first (named per video so parallel
+            # downloads into the same folder do not collide)
+            temp_filename = f"temp_{yt.video_id}_{filename}"
             temp_path = os.path.join(out_dir, temp_filename)
 
             audio_stream.download(output_path=out_dir, filename=temp_filename)
@@ -384,14 +385,16 @@ class PyTubeFixHandler:
             
             title = self.sanitize_path(yt.title.replace(' ', '-'))
             
-            # Download video and audio separately or use progressive stream
+            # Download video and audio separately or use progressive stream.
+            # Temp names carry the video ID: parallel downloads share temp_downloads.
+            temp_video_name = f"temp_video_{yt.video_id}.mp4"
             if audio_stream:
                 # Download separate streams
-                video_path = video_stream.download(output_path=output_folder, filename="temp_video.mp4")
-                audio_path = audio_stream.download(output_path=output_folder, filename="temp_audio.mp4")
+                video_path = video_stream.download(output_path=output_folder, filename=temp_video_name)
+                audio_path = audio_stream.download(output_path=output_folder, filename=f"temp_audio_{yt.video_id}.mp4")
             else:
                 # Use progressive stream (already has audio)
-                video_path = video_stream.download(output_path=output_folder, filename="temp_video.mp4")
+                video_path = video_stream.download(output_path=output_folder, filename=temp_video_name)
                 audio_path = None
             
             # Default save path for final combined file
@@ -6,19 +6,64 @@ using the yt-dlp package as a backup to pytubefix.
 
 import os
 import re
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Optional, Dict, Any, List
 from ..utils.helpers import ensure_directory
 from ..utils.anti_detection import AntiDetectionManager
 from ..utils.request_interceptor import anti_detection_interceptor, rate_limit
 
 
+def _freeze_opts(value: Any) -> Any:
+    """Hashable form of a yt-dlp options dict, used to key shared instances."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_opts(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_opts(v) for v in value)
+    return value
+
+
+# Options that load cookies when the instance is created; reusing such an
+# instance would keep serving cookies that have since changed
+_COOKIE_OPTS = ('cookiefile', 'cookiesfrombrowser')
+
+
+class _SharedYDLs:
+    """One thread's shared YoutubeDL instances, closed when dropped."""
+
+    def __init__(self):
+        self.instances: 'OrderedDict[Any, Any]' = OrderedDict()  # frozen opts -> YoutubeDL
+
+    def close_all(self):
+        """Close and forget every instance."""
+        instances = self.instances
+        while instances:
+            _, ydl = instances.popitem(last=False)
+            try:
+                ydl.close()
+            except Exception:
+                pass
+
+    def __del__(self):
+        # Runs when the owning thread exits (thread-local storage is freed)
+        self.close_all()
+
+
 class YTDLPHandler:
     """Handler for YT-DLP package functionality."""
+
+    # Shared metadata YoutubeDL instances kept per thread (distinct option sets)
+    _SHARED_YDL_MAX = 8
     
     def __init__(self, anti_detection: AntiDetectionManager = None):
         """Initialize the YT-DLP handler."""
         self._ydl = None
         self._initialized = False
+        self._local = threading.local()
+        # Every thread's shared instances, so close() can reach them all
+        self._shared_sets = weakref.WeakSet()
         self.anti_detection = anti_detection or AntiDetectionManager()
     
     def _ensure_initialized(self):
@@ -30,6 +75,63 @@ class YTDLPHandler:
                 self._initialized = True
             except ImportError:
                 raise ImportError("yt-dlp is not installed. Install with: pip install yt-dlp")
+
+    @contextmanager
+    def _shared_ydl(self, ydl_opts: Dict[str, Any]):
+        """
+        Yield a reusable YoutubeDL for metadata-only extraction.
+
+        Creating a YoutubeDL loads and compiles every extractor, which costs
+        more than many of the lookups it is used for. Instances are therefore
+        kept per option set and reused; they are per thread because YoutubeDL
+        is not thread-safe. Only use this for extract_info(..., download=False).
+
+        Options carrying cookies always get a fresh instance, so cookies are
+        re-read on every lookup. Instances are closed when evicted, when
+        their thread exits, or on close().
+        """
+        key = None
+        if not any(ydl_opts.get(opt) for opt in _COOKIE_OPTS):
+            try:
+                key = _freeze_opts(ydl_opts)
+                hash(key)
+            except TypeError:
+                key = None
+        if key is None:
+            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+                yield ydl
+            return
+
+        shared = getattr(self._local, 'ydls', None)
+        if shared is None:
+            shared = self._local.ydls = _SharedYDLs()
+            self._shared_sets.add(shared)
+        instances = shared.instances
+        ydl = instances.get(key)
+        if ydl is None:
+            ydl = instances[key] = self._ydl.YoutubeDL(dict(ydl_opts))
+            if len(instances) > self._SHARED_YDL_MAX:
+                _, evicted = instances.popitem(last=False)
+                evicted.close()
+        else:
+            instances.move_to_end(key)
+        yield ydl
+
+    def close(self):
+        """
+        Close the shared YoutubeDL instances of every thread.
+
+        Call when done with the handler (no lookups may be running); later
+        lookups simply create new instances.
+        """
+        for shared in list(self._shared_sets):
+            shared.close_all()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def extract_video_id(self, youtube_link: str) -> str:
         """
@@ -86,7 +188,7 @@ class YTDLPHandler:
             if cookies_file and os.path.exists(cookies_file):
                 ydl_opts['cookiefile'] = cookies_file
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 
                 return {
@@ -228,7 +330,8 @@ class YTDLPHandler:
     @anti_detection_interceptor
     @rate_limit(max_requests=2, window_minutes=1)
     def download_video(self, url: str, output_path: str = None, 
-                       quality: str = 'best', progress_callback: bool = True) -> str:
+                       quality: str = 'best', progress_callback: bool = True,
+                       connections: int = 1) -> str:
         """
         Download video from YouTube using yt-dlp.
         
@@ -237,6 +340,8 @@ class YTDLPHandler:
             output_path: Output path for the video file (directory path for yt-dlp)
             quality: Video quality ('best', 'worst', '720p', '1080p')
             progress_callback: Whether to show download progress
+            connections: Parallel HTTP range connections for the media file
+                         (1 = let yt-dlp download it over a single connection)
             
         Returns:
             str: Path to the downloaded video file
@@ -290,6 +395,14 @@ class YTDLPHandler:
             else:
                 video_url = video_id
             
+            # Split a single large file across several connections when asked
+            if connections > 1:
+                file_path = self._download_with_ranges(
+                    video_url, ydl_opts, output_path, video_id, connections, progress_callback
+                )
+                if file_path:
+                    return file_path
+            
             # Try to download with the requested format
             try:
                 with self._ydl.YoutubeDL(ydl_opts) as ydl:
@@ -338,6 +451,97 @@ class YTDLPHandler:
         except Exception as e:
             raise ValueError(f"Failed to download video: {e}")
     
+    def _download_with_ranges(self, video_url: str, ydl_opts: Dict[str, Any],
+                              output_path: str, video_id: str, connections: int,
+                              progress_callback: bool = True) -> Optional[str]:
+        """
+        Download a progressive (single-file) format using parallel range requests.
+
+        Returns:
+            Path to the downloaded file, or None if the selected format can't be
+            range-downloaded (caller should fall back to a regular yt-dlp download)
+        """
+        try:
+            with self._ydl.YoutubeDL({**ydl_opts, 'quiet': True}) as ydl:
+                info = ydl.extract_info(video_url, download=False)
+
+            # Merged (video+audio) and fragmented formats need yt-dlp itself
+            if info.get('requested_formats') or info.get('protocol') not in ('http', 'https'):
+                return None
+
+            file_path = os.path.join(output_path, f"{video_id}.{info.get('ext', 'mp4')}")
+            if self._range_download(info['url'], file_path, n_parts=connections,
+                                    headers=info.get('http_headers')):
+                return file_path
+        except Exception as e:
+            if progress_callback:
+                print(f"   Range download failed, using yt-dlp downloader: {e}")
+        return None
+
+    def _range_download(self, url: str, file_path: str, n_parts: int = 4,
+                        headers: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Download one URL over N parallel HTTP byte-range requests.
+
+        Each worker streams its slice straight into a pre-allocated file with
+        os.pwrite, so no part has to be buffered or stitched together afterwards.
+
+        Args:
+            url: Direct media URL (e.g. yt-dlp's info['url'])
+            file_path: Destination file path
+            n_parts: Number of parallel connections
+            headers: Extra request headers (e.g. yt-dlp's info['http_headers'])
+
+        Returns:
+            True if downloaded, False if the server (or platform) doesn't support it
+        """
+        import requests
+        from concurrent.futures import ThreadPoolExecutor
+        from requests.adapters import HTTPAdapter
+
+        if not hasattr(os, 'pwrite'):
+            return False
+
+        headers = dict(headers or {})
+        with requests.Session() as session:
+            session.mount('https://', HTTPAdapter(pool_maxsize=n_parts))
+            session.mount('http://', HTTPAdapter(pool_maxsize=n_parts))
+
+            head = session.head(url, headers=headers, allow_redirects=True, timeout=10)
+            size = int(head.headers.get('Content-Length', 0))
+            if head.status_code != 200 or head.headers.get('Accept-Ranges') != 'bytes' or size <= 0:
+                return False
+
+            part_size = -(-size // n_parts)
+            ranges = [(start, min(start + part_size, size) - 1)
+                      for start in range(0, size, part_size)]
+
+            def fetch(byte_range):
+                start, end = byte_range
+                part_headers = {**headers, 'Range': f'bytes={start}-{end}'}
+                with session.get(head.url, headers=part_headers, stream=True, timeout=30) as response:
+                    if response.status_code != 206:
+                        raise RuntimeError(f"Range request returned HTTP {response.status_code}")
+                    offset = start
+                    for chunk in response.iter_content(chunk_size=65536):
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                if offset != end + 1:
+                    raise RuntimeError(f"Incomplete range {start}-{end}")
+
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.ftruncate(fd, size)
+                with ThreadPoolExecutor(max_workers=n_parts) as executor:
+                    list(executor.map(fetch, ranges))
+            except Exception:
+                os.close(fd)
+                os.remove(file_path)
+                raise
+            os.close(fd)
+
+        return True
+
     def get_video_description(self, url: str) -> str:
         """
         Get the description of a YouTube video and extract lyrics if present.
@@ -357,7 +561,7 @@ class YTDLPHandler:
                 'extract_flat': False
             }
             
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 description = info.get('description', '')
                 
@@ -390,7 +594,7 @@ class YTDLPHandler:
                 'no_warnings': True
             }
             
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 formats = info.get('formats', [])
                 
@@ -417,7 +621,7 @@ class YTDLPHandler:
             self._ensure_initialized()
             ydl_opts = {'quiet': True, 'no_warnings': True}
             
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 return bool(info and info.get('id'))
         except Exception:
@@ -524,7 +728,7 @@ class YTDLPHandler:
                 'extract_flat': False
             }
             
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 
                 return {
@@ -786,7 +990,7 @@ class YTDLPHandler:
                 'cookiesfrombrowser': (browser,)
             }
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 return self._format_video_info(info, url)
 
@@ -837,7 +1041,7 @@ class YTDLPHandler:
                 'extract_flat': False
             }
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 heatmap = info.get('heatmap', [])
@@ -875,7 +1079,7 @@ class YTDLPHandler:
                 'extract_flat': False
             }
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 chapters = info.get('chapters', [])
@@ -990,7 +1194,7 @@ class YTDLPHandler:
                 }
             }
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 comments = info.get('comments', [])
@@ -1047,7 +1251,7 @@ class YTDLPHandler:
             }
 
             # First get video info to get the video ID
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 video_id = info.get('id', '')
 
@@ -1371,7 +1575,7 @@ class YTDLPHandler:
                 'extract_flat': False,
             }
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 return {
@@ -1944,7 +2148,7 @@ class YTDLPHandler:
                 'extract_flat': False,
             }
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 # Return comprehensive metadata
@@ -2085,7 +2289,7 @@ class YTDLPHandler:
                 'extract_flat': False,
             }
 
-            with self._ydl.YoutubeDL(ydl_opts) as ydl:
+            with self._shared_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
 
                 return {
@@ -15,14 +15,100 @@ The callable methods return the same types as the legacy API for backward compat
 - search() returns SearchResult
 """
 
-from typing import Optional, List, Dict, Any, Union, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Union, Iterable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime
+from functools import cached_property
+import json
 import os
+import re
+import tempfile
+import threading
 import time
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from .core.comments import CommentFilters, CommentOrder
+from .core.download import DownloadResult, MediaType
+from .core.live import LiveStatus
+from .core.search import SearchResult, SearchFilters, SearchResultItem, _EMPTY
 from .core.video_info import VideoInfo
+from .utils.cache import ttl_cached, single_flight
 
 if TYPE_CHECKING:
     from .api import YouTubeToolkit
+    from .handlers.scrapetube_handler import ScrapeTubeHandler
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps fallback for values search results may contain."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _video_cache_key(self, url: str, include: Optional[List[str]] = None):
+    """Cache key for video lookups: the same video under any URL form shares an entry."""
+    try:
+        video_id = self._toolkit.extract_video_id(url)
+    except ValueError:
+        video_id = url
+    return video_id, frozenset(include or ())
+
+
+# Lifetime of cached empty extras (no chapters/heatmap/transcript, ...)
+_NEGATIVE_TTL = 300
+
+# Lifetime of a cached live status; streams start and end on a minutes scale
+_LIVE_STATUS_TTL = 5
+
+
+# URL kind detection for GetAPI.__call__ (case-insensitive, no lowered copy)
+_PLAYLIST_URL_RE = re.compile(r'/playlist|list=', re.IGNORECASE)
+_CHANNEL_URL_RE = re.compile(r'/@|/channel/|/c/', re.IGNORECASE)
+
+# Process umask, read once at import: temp files are created 0600, so
+# thumbnails moved into place get the mode open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Thumbnail URL patterns by quality
+_THUMB_TEMPLATES = {
+    'maxres': 'https://i.ytimg.com/vi/{}/maxresdefault.jpg',
+    'standard': 'https://i.ytimg.com/vi/{}/sddefault.jpg',
+    'high': 'https://i.ytimg.com/vi/{}/hqdefault.jpg',
+    'medium': 'https://i.ytimg.com/vi/{}/mqdefault.jpg',
+    'default': 'https://i.ytimg.com/vi/{}/default.jpg',
+}
+
+def _drop_page_cache(f) -> None:
+    """Flush f to disk and ask the kernel to drop its cached pages.
+
+    Keeps bulk downloads from evicting other workloads' page cache. A no-op
+    beyond the flush on platforms without posix_fadvise.
+    """
+    f.flush()
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = f.fileno()
+    # Pages must be clean before DONTNEED can drop them
+    os.fdatasync(fd)
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+# scrapetube is optional: import its handler on first use and share one instance
+_scrapetube_handler = None
+
+
+def _get_scrapetube_handler() -> 'ScrapeTubeHandler':
+    """Return the shared ScrapeTubeHandler, creating it on first use."""
+    global _scrapetube_handler
+    if _scrapetube_handler is None:
+        from .handlers.scrapetube_handler import ScrapeTubeHandler
+        _scrapetube_handler = ScrapeTubeHandler()
+    return _scrapetube_handler
 
 
 # =============================================================================
@@ -36,6 +122,7 @@ class ChannelGetAPI:
         self._parent = parent
         self._toolkit = parent._toolkit
 
+    @ttl_cached()
     def __call__(self, channel: str) -> Dict[str, Any]:
         """
         Get channel information.
@@ -48,6 +135,7 @@ class ChannelGetAPI:
         """
         return self._toolkit.pytubefix.get_channel_info(channel)
 
+    @ttl_cached()
     def videos(self, channel: str,
                limit: Optional[int] = None,
                sort_by: str = 'newest',
@@ -66,8 +154,7 @@ class ChannelGetAPI:
         """
         if use_scrapetube:
             try:
-                from .handlers.scrapetube_handler import ScrapeTubeHandler
-                handler = ScrapeTubeHandler()
+                handler = _get_scrapetube_handler()
                 return handler.get_channel_videos(channel, limit=limit, sort_by=sort_by)
             except ImportError:
                 if self._toolkit.verbose:
@@ -77,6 +164,7 @@ class ChannelGetAPI:
             channel, content_type='videos', limit=limit, sort_by=sort_by
         )
 
+    @ttl_cached()
     def shorts(self, channel: str,
                limit: Optional[int] = None,
                use_scrapetube: bool = False) -> List[Dict[str, Any]]:
@@ -93,8 +181,7 @@ class ChannelGetAPI:
         """
         if use_scrapetube:
             try:
-                from .handlers.scrapetube_handler import ScrapeTubeHandler
-                handler = ScrapeTubeHandler()
+                handler = _get_scrapetube_handler()
                 return handler.get_channel_shorts(channel, limit=limit)
             except ImportError:
                 if self._toolkit.verbose:
@@ -104,6 +191,7 @@ class ChannelGetAPI:
             channel, content_type='shorts', limit=limit
         )
 
+    @ttl_cached()
     def streams(self, channel: str,
                 limit: Optional[int] = None,
                 use_scrapetube: bool = False) -> List[Dict[str, Any]]:
@@ -120,8 +208,7 @@ class ChannelGetAPI:
         """
         if use_scrapetube:
             try:
-                from .handlers.scrapetube_handler import ScrapeTubeHandler
-                handler = ScrapeTubeHandler()
+                handler = _get_scrapetube_handler()
                 return handler.get_channel_streams(channel, limit=limit)
             except ImportError:
                 if self._toolkit.verbose:
@@ -147,8 +234,7 @@ class ChannelGetAPI:
             ImportError: If scrapetube is not installed
         """
         try:
-            from .handlers.scrapetube_handler import ScrapeTubeHandler
-            handler = ScrapeTubeHandler()
+            handler = _get_scrapetube_handler()
 
             if content_type == 'videos':
                 return handler.get_channel_videos(channel, limit=None)
@@ -165,6 +251,7 @@ class ChannelGetAPI:
                 "Install with: pip install youtube-toolkit[scrapers]"
             )
 
+    @ttl_cached()
     def playlists(self, channel: str,
                   limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -181,6 +268,43 @@ class ChannelGetAPI:
             channel, content_type='playlists', limit=limit
         )
 
+    def bulk(self, channel: str,
+             tabs: Optional[List[str]] = None,
+             limit: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get several channel tabs at once.
+
+        YouTube serves each tab from its own browse request, so the tabs are
+        fetched concurrently and wall time is that of the slowest tab rather
+        than the sum. Results land in the toolkit cache, so later calls to
+        channel.videos()/shorts()/streams()/playlists() with the same
+        arguments are served without a request.
+
+        Args:
+            channel: Channel URL, handle, or ID
+            tabs: Any of 'videos', 'shorts', 'streams', 'playlists' (default: all)
+            limit: Maximum items per tab
+
+        Returns:
+            Dict mapping each requested tab to its list of info dicts
+        """
+        fetchers = {
+            'videos': self.videos,
+            'shorts': self.shorts,
+            'streams': self.streams,
+            'playlists': self.playlists,
+        }
+        tabs = list(fetchers) if tabs is None else list(dict.fromkeys(tabs))
+        for tab in tabs:
+            if tab not in fetchers:
+                raise ValueError(
+                    f"Invalid tab: {tab}. Use 'videos', 'shorts', 'streams', or 'playlists'"
+                )
+
+        with ThreadPoolExecutor(max_workers=len(tabs) or 1) as executor:
+            futures = {tab: executor.submit(fetchers[tab], channel, limit=limit) for tab in tabs}
+            return {tab: future.result() for tab, future in futures.items()}
+
 
 class PlaylistGetAPI:
     """Sub-API for playlist-related get operations."""
@@ -189,6 +313,7 @@ class PlaylistGetAPI:
         self._parent = parent
         self._toolkit = parent._toolkit
 
+    @ttl_cached()
     def __call__(self, url: str) -> Dict[str, Any]:
         """
         Get playlist information.
@@ -201,6 +326,7 @@ class PlaylistGetAPI:
         """
         return self._toolkit.pytubefix.get_playlist_info(url)
 
+    @ttl_cached()
     def urls(self, url: str) -> List[str]:
         """
         Get all video URLs from a playlist.
@@ -229,8 +355,7 @@ class PlaylistGetAPI:
         """
         if use_scrapetube:
             try:
-                from .handlers.scrapetube_handler import ScrapeTubeHandler
-                handler = ScrapeTubeHandler()
+                handler = _get_scrapetube_handler()
                 return handler.get_playlist_videos(url, limit=limit)
             except ImportError:
                 if self._toolkit.verbose:
@@ -250,6 +375,7 @@ class CommentsGetAPI:
         self._parent = parent
         self._toolkit = parent._toolkit
 
+    @single_flight()
     def __call__(self, url: str,
                  limit: int = 100,
                  order: str = 'relevance') -> Dict[str, Any]:
@@ -264,7 +390,6 @@ class CommentsGetAPI:
         Returns:
             CommentResult with comments and analytics
         """
-        from .core.comments import CommentFilters, CommentOrder
 
         order_enum = CommentOrder.RELEVANCE if order == 'relevance' else CommentOrder.TIME
         filters = CommentFilters(order=order_enum, max_results=limit)
@@ -303,7 +428,6 @@ class CommentsGetAPI:
         Returns:
             List of matching comments
         """
-        from .core.comments import CommentFilters
 
         filters = CommentFilters(search_terms=[query], max_results=limit)
         result = self._toolkit.comments(url, filters=filters)
@@ -319,6 +443,7 @@ class GetAPI:
         toolkit.get.video(url)              # Explicit video info
         toolkit.get.channel("@Fireship")    # Channel info
         toolkit.get.channel.videos(...)     # Channel videos
+        toolkit.get.channel.bulk(...)       # Several channel tabs at once
         toolkit.get.playlist(url)           # Playlist info
         toolkit.get.chapters(url)           # Video chapters
         toolkit.get.transcript(url)         # Video transcript
@@ -328,9 +453,27 @@ class GetAPI:
 
     def __init__(self, toolkit: 'YouTubeToolkit'):
         self._toolkit = toolkit
-        self.channel = ChannelGetAPI(self)
-        self.playlist = PlaylistGetAPI(self)
-        self.comments = CommentsGetAPI(self)
+
+    # Nested sub-APIs are built on first access
+    @cached_property
+    def channel(self) -> 'ChannelGetAPI':
+        """Channel info and tab listings."""
+        return ChannelGetAPI(self)
+
+    @cached_property
+    def playlist(self) -> 'PlaylistGetAPI':
+        """Playlist info and video URLs."""
+        return PlaylistGetAPI(self)
+
+    @cached_property
+    def comments(self) -> 'CommentsGetAPI':
+        """Video comments."""
+        return CommentsGetAPI(self)
+
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool shared by concurrent lookups (created on first use)."""
+        return ThreadPoolExecutor(max_workers=5, thread_name_prefix='youtube-toolkit-get')
 
     def __call__(self, url: str,
                  include: Optional[List[str]] = None) -> Union[VideoInfo, Dict[str, Any]]:
@@ -345,18 +488,18 @@ class GetAPI:
         Returns:
             VideoInfo for videos, dict for channels/playlists
         """
-        # Detect URL type
-        url_lower = url.lower()
-
-        if '/playlist' in url_lower or 'list=' in url_lower:
-            return self.playlist(url)
-        elif '/@' in url_lower or '/channel/' in url_lower or '/c/' in url_lower:
+        # Detect URL type. A bare handle is the cheapest test, so check it
+        # first; in URLs, playlist markers take precedence over channel ones.
+        if url[:1] == '@':
             return self.channel(url)
-        elif url.startswith('@'):
+        elif _PLAYLIST_URL_RE.search(url):
+            return self.playlist(url)
+        elif _CHANNEL_URL_RE.search(url):
             return self.channel(url)
         else:
             return self.video(url, include=include)
 
+    @ttl_cached(key=_video_cache_key)
     def video(self, url: str,
               include: Optional[List[str]] = None) -> VideoInfo:
         """
@@ -387,40 +530,33 @@ class GetAPI:
             like_count=info.get('like_count'),
         )
 
-        # Add extras if requested (stored as additional attributes)
+        # Add extras if requested (stored as additional attributes). Each is an
+        # independent request, so run them concurrently on the shared pool.
+        # Going through the cached accessors means videos without chapters,
+        # heatmaps etc. are not re-queried on every call.
         if include:
-            if 'chapters' in include:
-                try:
-                    video_info.chapters = self._toolkit.pytubefix.get_video_chapters(url)
-                except Exception:
-                    video_info.chapters = []
-
-            if 'heatmap' in include:
-                try:
-                    video_info.heatmap = self._toolkit.pytubefix.get_replayed_heatmap(url)
-                except Exception:
-                    video_info.heatmap = []
-
-            if 'key_moments' in include:
-                try:
-                    video_info.key_moments = self._toolkit.pytubefix.get_key_moments(url)
-                except Exception:
-                    video_info.key_moments = []
-
-            if 'transcript' in include:
-                try:
-                    video_info.transcript = self._toolkit.ytdlp.get_transcript(url)
-                except Exception:
-                    video_info.transcript = None
-
-            if 'lyrics' in include:
+            # name -> (fetcher, value on failure)
+            extras = {
+                'chapters': (self.chapters, []),
+                'heatmap': (self.heatmap, []),
+                'key_moments': (self.key_moments, []),
+                'transcript': (self.transcript, None),
+                'lyrics': (self.lyrics, None),
+            }
+            futures = {
+                name: self._executor.submit(fetch, url)
+                for name, (fetch, _) in extras.items() if name in include
+            }
+            for name, future in futures.items():
                 try:
-                    video_info.lyrics = self._toolkit.ytdlp.get_lyrics(url)
+                    value = future.result()
                 except Exception:
-                    video_info.lyrics = None
+                    value = extras[name][1]
+                setattr(video_info, name, value)
 
         return video_info
 
+    @ttl_cached(key=_video_cache_key, negative_ttl=_NEGATIVE_TTL)
     def chapters(self, url: str) -> List[Dict[str, Any]]:
         """
         Get video chapters/timestamps.
@@ -433,6 +569,7 @@ class GetAPI:
         """
         return self._toolkit.pytubefix.get_video_chapters(url)
 
+    @ttl_cached(key=_video_cache_key, negative_ttl=_NEGATIVE_TTL)
     def key_moments(self, url: str) -> List[Dict[str, Any]]:
         """
         Get AI-generated key moments.
@@ -445,6 +582,7 @@ class GetAPI:
         """
         return self._toolkit.pytubefix.get_key_moments(url)
 
+    @ttl_cached(key=_video_cache_key, negative_ttl=_NEGATIVE_TTL)
     def heatmap(self, url: str) -> List[Dict[str, Any]]:
         """
         Get viewer engagement heatmap (most replayed sections).
@@ -457,6 +595,7 @@ class GetAPI:
         """
         return self._toolkit.pytubefix.get_replayed_heatmap(url)
 
+    @ttl_cached(negative_ttl=_NEGATIVE_TTL)
     def transcript(self, url: str, lang: str = 'en') -> Optional[str]:
         """
         Get auto-generated transcript.
@@ -470,6 +609,7 @@ class GetAPI:
         """
         return self._toolkit.ytdlp.get_transcript(url)
 
+    @ttl_cached(key=_video_cache_key, negative_ttl=_NEGATIVE_TTL)
     def lyrics(self, url: str) -> Optional[str]:
         """
         Get lyrics from video (if available in description/metadata).
@@ -588,9 +728,15 @@ class DownloadAPI:
 
     def __init__(self, toolkit: 'YouTubeToolkit'):
         self._toolkit = toolkit
+        # Thumbnail path -> (url, size, mtime_ns, ETag, Last-Modified) of the
+        # copy we last wrote there, for conditional re-downloads
+        self._thumb_validators: Dict[str, tuple] = {}
+        # Serializes pool resizes across concurrent thumbnails() batches
+        self._pool_lock = threading.Lock()
+        self._pool_maxsize = 0
 
     def __call__(self, url: str,
-                 type: str = 'audio',
+                 type: Union[str, MediaType] = MediaType.AUDIO,
                  format: str = 'wav',
                  quality: str = 'best',
                  output_path: Optional[str] = None,
@@ -602,7 +748,7 @@ class DownloadAPI:
 
         Args:
             url: Video URL
-            type: 'audio' or 'video'
+            type: MediaType.AUDIO / MediaType.VIDEO (or 'audio' / 'video')
             format: For audio: 'wav', 'mp3', 'm4a'. For video: ignored
             quality: For video: 'best', '720p', '1080p', etc.
             output_path: Output directory or file path
@@ -612,42 +758,30 @@ class DownloadAPI:
         Returns:
             DownloadResult object with file path and metadata
         """
-        from .core.download import DownloadResult
-
-        start_time = time.time()
+        start_time = time.perf_counter()
         backend_used = None
 
         try:
-            if type == 'audio':
-                file_path = self.audio(
-                    url,
-                    format=format,
-                    output_path=output_path,
-                    bitrate=bitrate,
-                    progress_callback=progress,
-                )
-                backend_used = 'pytubefix/yt-dlp'
-                result_format = format
-                result_quality = bitrate
-            elif type == 'video':
-                file_path = self.video(
-                    url,
-                    quality=quality,
-                    output_path=output_path,
-                    progress_callback=progress,
-                )
-                backend_used = 'yt-dlp/pytubefix'
-                result_format = 'mp4'
-                result_quality = quality
-            else:
-                raise ValueError(f"Invalid type: {type}. Must be 'audio' or 'video'")
+            try:
+                method_name, backend_used, describe = self._DISPATCH[type]
+            except KeyError:
+                raise ValueError(f"Invalid type: {type}. Must be 'audio' or 'video'") from None
+            options, result_format, result_quality = describe(format, quality, bitrate)
+            # Looked up on the instance so overrides and patches of audio()/video() apply
+            file_path = getattr(self, method_name)(
+                url,
+                output_path=output_path,
+                progress_callback=progress,
+                **options,
+            )
 
-            download_time = time.time() - start_time
+            download_time = time.perf_counter() - start_time
 
-            # Get file size if file exists
-            file_size = None
-            if os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
+            # Get file size if file exists (one stat instead of exists + getsize)
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError:
+                file_size = None
 
             return DownloadResult(
                 file_path=file_path,
@@ -660,7 +794,7 @@ class DownloadAPI:
             )
 
         except Exception as e:
-            download_time = time.time() - start_time
+            download_time = time.perf_counter() - start_time
             return DownloadResult(
                 file_path=output_path or '',
                 success=False,
@@ -702,7 +836,8 @@ class DownloadAPI:
               quality: str = 'best',
               output_path: Optional[str] = None,
               prefer_yt_dlp: bool = False,
-              progress_callback: bool = True) -> str:
+              progress_callback: bool = True,
+              connections: int = 1) -> str:
         """
         Download video.
 
@@ -712,6 +847,8 @@ class DownloadAPI:
             output_path: Output directory or file path
             prefer_yt_dlp: Use yt-dlp instead of pytubefix
             progress_callback: Show download progress
+            connections: Parallel HTTP range connections for yt-dlp downloads
+                         of single-file formats (useful on fast links)
 
         Returns:
             Path to downloaded video file
@@ -721,9 +858,20 @@ class DownloadAPI:
             quality=quality,
             output_path=output_path,
             prefer_yt_dlp=prefer_yt_dlp,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            connections=connections
         )
 
+    # type -> (method name, backend label, (format, quality, bitrate) ->
+    #          (method kwargs, result format, result quality)); built once per class.
+    # MediaType is a str enum, so plain 'audio'/'video' strings hit the same keys.
+    _DISPATCH = {
+        MediaType.AUDIO: ('audio', 'pytubefix/yt-dlp',
+                  lambda fmt, quality, bitrate: ({'format': fmt, 'bitrate': bitrate}, fmt, bitrate)),
+        MediaType.VIDEO: ('video', 'yt-dlp/pytubefix',
+                  lambda fmt, quality, bitrate: ({'quality': quality}, 'mp4', quality)),
+    }
+
     def captions(self, url: str,
                  lang: str = 'en',
                  format: str = 'srt',
@@ -749,41 +897,107 @@ class DownloadAPI:
 
     def thumbnail(self, url: str,
                   output_path: Optional[str] = None,
-                  quality: str = 'maxres') -> str:
+                  quality: str = 'maxres',
+                  bypass_page_cache: bool = False) -> str:
         """
         Download video thumbnail.
 
         Args:
             url: Video URL
             output_path: Output directory or file path
-            quality: Thumbnail quality ('maxres', 'high', 'medium', 'default')
+            quality: Thumbnail quality ('maxres', 'standard', 'high', 'medium', 'default')
+            bypass_page_cache: Sync the file and evict it from the OS page cache
+                               after writing (for bulk downloads to a dedicated disk)
 
         Returns:
             Path to downloaded thumbnail
         """
-        import requests
-        import os
+        return self._fetch_thumbnail(url, output_path, quality, bypass_page_cache)
 
-        video_id = self._toolkit.extract_video_id(url)
+    def thumbnails(self, urls: Iterable[str],
+                   output_path: Optional[str] = None,
+                   quality: str = 'maxres',
+                   max_workers: int = 8,
+                   bypass_page_cache: bool = False) -> List[Optional[str]]:
+        """
+        Download thumbnails for many videos in parallel.
 
-        # Thumbnail URL patterns by quality
-        quality_urls = {
-            'maxres': f'https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg',
-            'high': f'https://i.ytimg.com/vi/{video_id}/hqdefault.jpg',
-            'medium': f'https://i.ytimg.com/vi/{video_id}/mqdefault.jpg',
-            'default': f'https://i.ytimg.com/vi/{video_id}/default.jpg',
-        }
+        All requests go through the DownloadAPI's keep-alive session, so
+        connections to the thumbnail host are reused instead of reopened
+        for every video.
 
-        thumb_url = quality_urls.get(quality, quality_urls['high'])
+        Args:
+            urls: Video URLs
+            output_path: Output directory (defaults to the current directory)
+            quality: Thumbnail quality ('maxres', 'standard', 'high', 'medium', 'default')
+            max_workers: Number of concurrent downloads
+            bypass_page_cache: Sync each file and evict it from the OS page cache
 
-        # Try to get thumbnail, fallback to lower quality if not available
-        response = requests.get(thumb_url)
-        if response.status_code != 200 and quality == 'maxres':
-            thumb_url = quality_urls['high']
-            response = requests.get(thumb_url)
+        Returns:
+            Thumbnail paths in the same order as urls (None where a download failed)
+        """
+        urls = list(urls)
+        if not urls:
+            return []
 
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to download thumbnail: {response.status_code}")
+        workers = max(1, min(max_workers, len(urls)))
+        self._grow_pool(workers)
+
+        def fetch(video_url: str) -> Optional[str]:
+            try:
+                return self._fetch_thumbnail(video_url, output_path, quality, bypass_page_cache)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, urls))
+
+    _POOL_MAXSIZE = 16
+
+    # (connect, read) seconds for thumbnail requests, so a stalled
+    # connection cannot hold a worker forever
+    _THUMB_TIMEOUT = (5, 30)
+
+    @cached_property
+    def _session(self) -> requests.Session:
+        """Pooled HTTP session for direct downloads (created on first use)."""
+        session = requests.Session()
+        self._mount_pool(session, self._POOL_MAXSIZE)
+        return session
+
+    def _mount_pool(self, session: requests.Session, maxsize: int) -> None:
+        """Mount a connection pool keeping up to maxsize connections per host.
+
+        The adapter it replaces is closed so its pooled sockets are released;
+        requests already running on it finish on their own connection.
+        """
+        replaced = {session.adapters.get(prefix) for prefix in ('https://', 'http://')}
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        self._pool_maxsize = maxsize
+        for old in replaced:
+            if old is not None:
+                old.close()
+
+    def _grow_pool(self, workers: int) -> None:
+        """Make sure the pool can keep one live connection per worker.
+
+        Without this, workers beyond pool_maxsize would open a connection,
+        use it once and throw it away on every request. The pool only ever
+        grows, so a narrow batch can't shrink it under a wider one.
+        """
+        session = self._session
+        with self._pool_lock:
+            if workers > self._pool_maxsize:
+                self._mount_pool(session, workers)
+
+    def _fetch_thumbnail(self, url: str, output_path: Optional[str],
+                         quality: str, bypass_page_cache: bool = False) -> str:
+        """Download one thumbnail over the shared session."""
+        session = self._session
+        video_id = self._toolkit.extract_video_id(url)
+        thumb_url = _THUMB_TEMPLATES.get(quality, _THUMB_TEMPLATES['high']).format(video_id)
 
         # Determine output path
         if output_path is None:
@@ -791,8 +1005,81 @@ class DownloadAPI:
         elif os.path.isdir(output_path):
             output_path = os.path.join(output_path, f'{video_id}_thumbnail.jpg')
 
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        # maxres is missing for many videos; probe it with HEAD so the
+        # fallback doesn't pay for downloading (and discarding) a 404 body
+        if quality == 'maxres':
+            probe = session.head(thumb_url, timeout=self._THUMB_TIMEOUT, allow_redirects=True)
+            if probe.status_code != 200:
+                thumb_url = _THUMB_TEMPLATES['high'].format(video_id)
+
+        # Revalidate a copy we downloaded earlier with the server's own
+        # validators, only if it came from the same URL (same quality) and
+        # the file is unchanged since we wrote it
+        headers = {}
+        key = os.path.abspath(output_path)
+        known = self._thumb_validators.get(key)
+        if known is not None and known[0] == thumb_url:
+            try:
+                st = os.stat(output_path)
+            except OSError:
+                st = None
+            if st is not None and (st.st_size, st.st_mtime_ns) == known[1:3]:
+                etag, last_modified = known[3:]
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+        response = session.get(thumb_url, headers=headers, stream=True,
+                               timeout=self._THUMB_TIMEOUT)
+        try:
+            if response.status_code == 304 and headers:
+                return output_path
+            if response.status_code != 200:
+                raise RuntimeError(f"Failed to download thumbnail: {response.status_code}")
+
+            # Stream the body in 64 KiB chunks. Size the write buffer to the
+            # image (between one chunk and 1 MiB) so wide batches don't each
+            # hold a 1 MiB buffer for a ~100 KiB JPEG.
+            try:
+                length = int(response.headers.get('Content-Length') or 0)
+            except (TypeError, ValueError):
+                length = 0
+            buffering = min(max(length, 65536), 1 << 20) if length > 0 else 1 << 20
+
+            # Write to a temp file next to the target and move it into place
+            # once the whole body has arrived, so a failed transfer never
+            # truncates an existing thumbnail or leaves a partial JPEG
+            tmp = tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(os.path.abspath(output_path)),
+                prefix='.thumb_', suffix='.part', delete=False,
+                buffering=buffering)
+            try:
+                with tmp as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                    if bypass_page_cache:
+                        _drop_page_cache(f)
+                os.chmod(tmp.name, 0o666 & ~_UMASK)
+                os.replace(tmp.name, output_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp.name)
+                except OSError:
+                    pass
+                raise
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                st = os.stat(output_path)
+                self._thumb_validators[key] = (thumb_url, st.st_size, st.st_mtime_ns,
+                                               etag, last_modified)
+            else:
+                self._thumb_validators.pop(key, None)
+        finally:
+            # Hand the connection back to the pool even on errors
+            response.close()
 
         return output_path
 
@@ -800,6 +1087,7 @@ class DownloadAPI:
                  type: str = 'audio',
                  format: str = 'mp3',
                  output_path: Optional[str] = None,
+                 concurrency: int = 4,
                  **kwargs) -> Dict[str, Any]:
         """
         Download all videos from a playlist.
@@ -809,6 +1097,7 @@ class DownloadAPI:
             type: 'audio' or 'video'
             format: Output format
             output_path: Output directory
+            concurrency: Number of videos downloaded in parallel (1 = sequential)
             **kwargs: Additional options
 
         Returns:
@@ -819,6 +1108,7 @@ class DownloadAPI:
             media_type=type,
             format=format,
             output_path=output_path,
+            concurrency=concurrency,
             **kwargs
         )
 
@@ -980,7 +1270,9 @@ class SearchAPI:
         toolkit.search.videos("query", limit=20)        # Explicit videos -> List[Dict]
         toolkit.search.channels("query")                # Channels -> List[Dict]
         toolkit.search.playlists("query")               # Playlists -> List[Dict]
+        toolkit.search.all("query")                     # Every result type, one request -> Dict
         toolkit.search.with_filters("query", ...)       # Advanced filters -> Dict
+        toolkit.search.save_results("out.jsonl", res)   # Write results as JSON Lines -> int
     """
 
     def __init__(self, toolkit: 'YouTubeToolkit'):
@@ -1000,8 +1292,6 @@ class SearchAPI:
         Returns:
             SearchResult object containing search results
         """
-        from .core.search import SearchResult, SearchFilters, SearchResultItem
-
         if filters is None:
             filters = SearchFilters()
 
@@ -1011,25 +1301,18 @@ class SearchAPI:
         raw_result = self._toolkit.advanced_search(query, filters, max_results)
 
         # Convert to SearchResult
-        items = []
         raw_items = raw_result.get('items', [])
 
-        for item in raw_items:
-            if isinstance(item, SearchResultItem):
-                items.append(item)
-            elif isinstance(item, dict):
-                items.append(SearchResultItem(
-                    kind=item.get('kind', 'youtube#video'),
-                    etag=item.get('etag', ''),
-                    video_id=item.get('video_id', item.get('id', {}).get('videoId', '')),
-                    title=item.get('title', item.get('snippet', {}).get('title', '')),
-                    description=item.get('description', item.get('snippet', {}).get('description', '')),
-                    channel_title=item.get('channel_title', item.get('snippet', {}).get('channelTitle', '')),
-                ))
+        # max_results bounds the list; slice once and convert in one pass.
+        # Backends may mix typed items and dicts, so dispatch per item.
+        page = raw_items[:max_results]
+        items = [item if isinstance(item, SearchResultItem) else SearchResultItem.from_backend(item)
+                 for item in page
+                 if isinstance(item, (SearchResultItem, dict))]
 
         return SearchResult(
             items=items,
-            total_results=raw_result.get('pageInfo', {}).get('totalResults', len(items)),
+            total_results=(raw_result.get('pageInfo') or _EMPTY).get('totalResults', len(items)),
             query=query,
             filters_applied=filters,
             next_page_token=raw_result.get('nextPageToken'),
@@ -1063,14 +1346,13 @@ class SearchAPI:
 
         # Fallback to scrapetube
         try:
-            from .handlers.scrapetube_handler import ScrapeTubeHandler
-            handler = ScrapeTubeHandler()
-            return handler.search(query, limit=limit)
+            return _get_scrapetube_handler().search(query, limit=limit)
         except ImportError:
             pass
 
         return []
 
+    @ttl_cached()
     def channels(self, query: str,
                  limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -1088,6 +1370,7 @@ class SearchAPI:
         )
         return results.get('channels', [])
 
+    @ttl_cached()
     def playlists(self, query: str,
                   limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -1105,6 +1388,32 @@ class SearchAPI:
         )
         return results.get('playlists', [])
 
+    @ttl_cached()
+    def all(self, query: str, limit: int = 20) -> Dict[str, List[Any]]:
+        """
+        Search for every result type with a single request.
+
+        Unlike channels()/playlists(), which filter the search to one type,
+        this returns the mixed results YouTube shows for the query.
+
+        Args:
+            query: Search query
+            limit: Maximum results per type
+
+        Returns:
+            Dict with videos, shorts, channels, playlists and suggestions lists
+        """
+        results = self._toolkit.pytubefix.advanced_search(
+            query, result_type='all', max_results=limit
+        )
+        return {
+            'videos': results.get('videos', []),
+            'shorts': results.get('shorts', []),
+            'channels': results.get('channels', []),
+            'playlists': results.get('playlists', []),
+            'suggestions': results.get('completion_suggestions', []),
+        }
+
     def with_filters(self, query: str,
                      duration: Optional[str] = None,
                      upload_date: Optional[str] = None,
@@ -1137,10 +1446,14 @@ class SearchAPI:
             max_results=max_results
         )
 
+    @ttl_cached(negative_ttl=_NEGATIVE_TTL)
     def suggestions(self, query: str) -> List[str]:
         """
         Get search autocomplete suggestions.
 
+        Suggestions are cached per query, so retyping the same prefix does not
+        go back to the network.
+
         Args:
             query: Partial search query
 
@@ -1149,12 +1462,10 @@ class SearchAPI:
         """
         return self._toolkit.pytubefix.get_search_suggestions(query)
 
-    @property
+    @cached_property
     def trending(self) -> 'TrendingSearchAPI':
         """Access trending search functionality."""
-        if not hasattr(self, '_trending'):
-            self._trending = TrendingSearchAPI(self._toolkit)
-        return self._trending
+        return TrendingSearchAPI(self._toolkit)
 
     def categories(self, region: str = 'US', language: str = 'en') -> List[Dict[str, Any]]:
         """
@@ -1193,6 +1504,33 @@ class SearchAPI:
         """
         return self._toolkit.youtube_api.get_supported_languages(display_language)
 
+    def save_results(self, path: str,
+                     results: Union[SearchResult, Iterable[Any]]) -> int:
+        """
+        Save search results to a JSON Lines file (one item per line).
+
+        Lines go through a single 1 MiB buffer and reach the disk in a few
+        large writes rather than one small write per item.
+
+        Args:
+            path: Output file path
+            results: SearchResult, or an iterable of SearchResultItem / dict items
+
+        Returns:
+            Number of items written
+        """
+        items = results.items if isinstance(results, SearchResult) else results
+        dumps = json.dumps
+        count = 0
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write = f.write
+            for item in items:
+                if isinstance(item, SearchResultItem):
+                    item = asdict(item)
+                write(dumps(item, ensure_ascii=False, default=_json_default) + '\n')
+                count += 1
+        return count
+
 
 class TrendingSearchAPI:
     """
@@ -1295,14 +1633,16 @@ class AnalyzeAPI:
         Returns:
             Dict with heatmap and key_moments data
         """
+        # Via the cached get accessors, so the data is shared with get.heatmap()
+        # and get.key_moments() for the same video
         result = {}
         try:
-            result['heatmap'] = self._toolkit.pytubefix.get_replayed_heatmap(url)
+            result['heatmap'] = self._toolkit.get.heatmap(url)
         except Exception:
             result['heatmap'] = []
 
         try:
-            result['key_moments'] = self._toolkit.pytubefix.get_key_moments(url)
+            result['key_moments'] = self._toolkit.get.key_moments(url)
         except Exception:
             result['key_moments'] = []
 
@@ -1321,7 +1661,6 @@ class AnalyzeAPI:
         Returns:
             CommentResult with comments and analytics
         """
-        from .core.comments import CommentFilters, CommentOrder
 
         order = CommentOrder.RELEVANCE if sort == 'relevance' else CommentOrder.TIME
         filters = CommentFilters(order=order, max_results=max_comments)
@@ -1340,6 +1679,7 @@ class AnalyzeAPI:
         """
         return self._toolkit.captions(url)
 
+    @ttl_cached(key=_video_cache_key, negative_ttl=_NEGATIVE_TTL)
     def sponsorblock(self, url: str) -> List[Dict[str, Any]]:
         """
         Get SponsorBlock segments for a video.
@@ -1402,14 +1742,19 @@ class LiveStreamSubAPI:
     def __init__(self, toolkit: 'YouTubeToolkit'):
         self._toolkit = toolkit
 
-    def status(self, url: str) -> Dict[str, Any]:
+    @ttl_cached(key=_video_cache_key, ttl=_LIVE_STATUS_TTL)
+    def status(self, url: str) -> LiveStatus:
         """
         Get live stream status.
 
+        Results are reused for a few seconds, so status() followed by
+        is_live() for the same video makes one request.
+
         Returns:
-            Dict with is_live, was_live, live_status, release_timestamp
+            LiveStatus with is_live, was_live, live_status, release_timestamp
+            (also readable dict-style, e.g. status['is_live'])
         """
-        return self._toolkit.yt_dlp.get_live_status(url)
+        return LiveStatus.from_dict(self._toolkit.yt_dlp.get_live_status(url))
 
     def is_live(self, url: str) -> bool:
         """
@@ -1421,8 +1766,30 @@ class LiveStreamSubAPI:
         Returns:
             True if currently live streaming
         """
-        status = self.status(url)
-        return status.get('is_live', False)
+        return bool(self.status(url).is_live)
+
+    def batch_is_live(self, urls: Iterable[str], max_workers: int = 8) -> Dict[str, bool]:
+        """
+        Check several videos for live status concurrently.
+
+        Args:
+            urls: YouTube video URLs
+            max_workers: Maximum number of concurrent status requests
+
+        Returns:
+            Dict mapping each URL to True if currently live. URLs whose status
+            could not be fetched map to False.
+        """
+        urls = list(dict.fromkeys(urls))
+
+        def check(url: str) -> bool:
+            try:
+                return self.is_live(url)
+            except Exception:
+                return False
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            return dict(zip(urls, executor.map(check, urls)))
 
     def download(self, url: str, output_path: Optional[str] = None,
                  from_start: bool = False,
@@ -1452,11 +1819,16 @@ class StreamAPI:
         buffer = toolkit.stream.video(url)              # Video buffer
         status = toolkit.stream.live.status(url)        # Live stream status
         is_live = toolkit.stream.live.is_live(url)      # Check if live
+        live = toolkit.stream.live.batch_is_live(urls)  # Check many at once
     """
 
     def __init__(self, toolkit: 'YouTubeToolkit'):
         self._toolkit = toolkit
-        self.live = LiveStreamSubAPI(toolkit)
+
+    @cached_property
+    def live(self) -> 'LiveStreamSubAPI':
+        """Live stream operations (built on first access)."""
+        return LiveStreamSubAPI(self._toolkit)
 
     def __call__(self, url: str, stream_type: str = 'audio',
                  quality: str = 'best') -> bytes:
@@ -1,17 +1,35 @@
+import array
+import asyncio
 import time
 import random
+import sys
 import threading
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Any
+from dataclasses import dataclass
+from datetime import datetime
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
-@dataclass
+# Bound once: called on every request, under AntiDetectionManager.lock
+_random = random.random
+
+# Encodings urllib3 can decode here; includes br/zstd when brotli/zstandard
+# are installed, so compressed bodies are only requested when usable
+_ACCEPT_ENCODING = ', '.join(ACCEPT_ENCODING.split(','))
+
+@dataclass(slots=True, frozen=True)
 class RequestRecord:
-    """Record of a request for analytics."""
-    timestamp: datetime
+    """
+    Record of a request for analytics (slotted: thousands are kept per window).
+
+    method and user_agent are interned strings, so records share one copy
+    of each distinct value rather than holding their own.
+    """
+    timestamp: float  # time.monotonic() when recorded
     url: str
     method: str
     success: bool
@@ -19,47 +37,130 @@ class RequestRecord:
     user_agent: str
 
 class RequestAnalytics:
-    """Track request patterns to optimize anti-detection."""
+    """
+    Track request patterns to optimize anti-detection.
+
+    Request frequency and success rate come from per-second counters kept in
+    a ring covering the window, so they cost the same however many requests
+    were made. Individual RequestRecords are kept only for get_recent_requests().
+    """
+
+    # Seconds window counts are reused before being summed again.
+    # apply_delay() asks for both on every request; they move slowly.
+    stats_ttl = 0.5
     
     def __init__(self, window_minutes: int = 60):
         self.window_minutes = window_minutes
-        self.requests: List[RequestRecord] = []
+        self._stats: Dict[int, tuple] = {}  # minutes -> ((requests, successes), expires_at)
+        # Oldest first; records only ever arrive in time order
+        self.requests: Deque[RequestRecord] = deque()
         self.lock = threading.Lock()
+
+        # Ring of per-second counters: slot second % size holds that second's
+        # requests and successes. Slots between the last recorded second and
+        # a new one are zeroed on record, so slots up to _last_second are current.
+        self._bucket_size = max(1, window_minutes * 60)
+        self._bucket_total = array.array('i', bytes(4 * self._bucket_size))
+        self._bucket_ok = array.array('i', bytes(4 * self._bucket_size))
+        self._last_second: Optional[int] = None
     
     def record_request(self, url: str, method: str, success: bool, 
                       response_time: float, user_agent: str):
         """Record a request for analysis."""
         with self.lock:
+            # Read the clock under the lock so records are appended in time order
+            now = time.monotonic()
             record = RequestRecord(
-                timestamp=datetime.now(),
-                url=url, method=method, success=success,
-                response_time=response_time, user_agent=user_agent
+                timestamp=now,
+                url=url, method=sys.intern(method), success=success,
+                response_time=response_time, user_agent=sys.intern(user_agent)
             )
             self.requests.append(record)
             
-            # Clean old records
-            cutoff = datetime.now() - timedelta(minutes=self.window_minutes)
-            self.requests = [r for r in self.requests if r.timestamp > cutoff]
+            # Drop records that fell out of the window (always at the left end)
+            cutoff = now - self.window_minutes * 60
+            while self.requests and self.requests[0].timestamp <= cutoff:
+                self.requests.popleft()
+
+            second = int(now)
+            self._advance_buckets(second)
+            idx = second % self._bucket_size
+            self._bucket_total[idx] += 1
+            self._bucket_ok[idx] += success
+
+    def _advance_buckets(self, second: int):
+        """Zero the slots of seconds skipped since the last record (lock held)."""
+        last = self._last_second
+        if last is not None and second > last:
+            size = self._bucket_size
+            for s in range(max(last + 1, second - size + 1), second + 1):
+                self._bucket_total[s % size] = 0
+                self._bucket_ok[s % size] = 0
+        if last is None or second > last:
+            self._last_second = second
+
+    def _window_counts(self, minutes: int) -> tuple:
+        """(requests, successes) over the last N minutes from the counters."""
+        size = self._bucket_size
+        now = int(time.monotonic())
+        with self.lock:
+            last = self._last_second
+            start = now - min(int(minutes * 60), size) + 1
+            if last is None or last < start:
+                return 0, 0
+            i, j = start % size, last % size
+            if i <= j:
+                return sum(self._bucket_total[i:j + 1]), sum(self._bucket_ok[i:j + 1])
+            return (sum(self._bucket_total[i:]) + sum(self._bucket_total[:j + 1]),
+                    sum(self._bucket_ok[i:]) + sum(self._bucket_ok[:j + 1]))
     
+    def _iter_recent(self, minutes: int) -> Iterator[RequestRecord]:
+        """
+        Yield requests from the last N minutes, newest first.
+
+        Holds the lock until exhausted or closed, so consume it right away.
+        """
+        cutoff = time.monotonic() - minutes * 60
+        with self.lock:
+            # Walk back from the newest record and stop at the window edge
+            for record in reversed(self.requests):
+                if record.timestamp <= cutoff:
+                    return
+                yield record
+
     def get_recent_requests(self, minutes: int = 5) -> List[RequestRecord]:
         """Get requests from the last N minutes."""
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        return [r for r in self.requests if r.timestamp > cutoff]
+        recent = list(self._iter_recent(minutes))
+        recent.reverse()
+        return recent
+
+    def count_recent_requests(self, minutes: int = 5) -> int:
+        """Number of requests in the last N minutes, without copying them."""
+        return sum(1 for _ in self._iter_recent(minutes))
+    
+    def _recent_counts(self, minutes: int) -> tuple:
+        """(requests, successes) over the last N minutes, reused for stats_ttl."""
+        now = time.monotonic()
+        entry = self._stats.get(minutes)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        counts = self._window_counts(minutes)
+        self._stats[minutes] = (counts, now + self.stats_ttl)
+        return counts
     
     def get_request_frequency(self, minutes: int = 5) -> float:
         """Get requests per minute in the last N minutes."""
-        recent = self.get_recent_requests(minutes)
-        if not recent:
+        total, _ = self._recent_counts(minutes)
+        if not total:
             return 0.0
-        return len(recent) / minutes
+        return total / minutes
     
     def get_success_rate(self, minutes: int = 10) -> float:
         """Get success rate in the last N minutes."""
-        recent = self.get_recent_requests(minutes)
-        if not recent:
+        total, successful = self._recent_counts(minutes)
+        if not total:
             return 1.0
-        successful = sum(1 for r in recent if r.success)
-        return successful / len(recent)
+        return successful / total
 
 class StealthSession:
     """Enhanced session with anti-detection capabilities."""
@@ -73,27 +174,34 @@ class StealthSession:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0'
         ]
+        # Full header set per user agent, built once; rotating picks one
+        self._header_variants = [self._build_headers(ua) for ua in self.user_agents]
         
         # Configure retry strategy
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Handlers share this session across threads (thumbnails, search,
+        # SponsorBlock), so keep enough idle connections to avoid re-handshakes
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                              max_retries=retry_strategy, pool_block=False)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
         # Set initial headers
         self._update_headers()
     
-    def _update_headers(self):
-        """Update session headers with stealth values."""
-        self.session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
+    @staticmethod
+    def _build_headers(user_agent: str) -> Dict[str, str]:
+        """Stealth header set for one user agent."""
+        return {
+            'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': _ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -101,7 +209,16 @@ class StealthSession:
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0'
-        })
+        }
+
+    def _update_headers(self):
+        """Update session headers with stealth values."""
+        index = random.randrange(len(self._header_variants))
+        self.session.headers.update(self._header_variants[index])
+        # Kept alongside the headers so readers skip the case-insensitive lookup
+        self.current_user_agent = self.user_agents[index]
+        # Plain-dict copy handed out by get_stealth_headers(); rebuilt on rotation
+        self._headers_snapshot = dict(self.session.headers)
     
     def rotate_user_agent(self):
         """Rotate to a different user agent."""
@@ -121,7 +238,9 @@ class AntiDetectionManager:
     def __init__(self):
         self.stealth_session = StealthSession()
         self.analytics = RequestAnalytics()
-        self.last_request_time = 0
+        self.last_request_time = float('-inf')  # time.monotonic(), for delay math
+        self.last_request_wallclock = 0.0  # time.time(), for reporting only
+        self._last_request_iso = (0.0, 'Never')  # (wallclock, formatted) for get_status
         self.min_delay = 1.0  # Minimum delay between requests
         self.max_delay = 5.0   # Maximum delay between requests
         self.lock = threading.Lock()
@@ -129,11 +248,11 @@ class AntiDetectionManager:
     def apply_delay(self):
         """Apply intelligent delay based on analytics."""
         with self.lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             time_since_last = current_time - self.last_request_time
             
-            # Base delay
-            base_delay = random.uniform(self.min_delay, self.max_delay)
+            # Base delay (uniform in [min_delay, max_delay])
+            base_delay = self.min_delay + (self.max_delay - self.min_delay) * _random()
             
             # Adjust based on recent activity
             recent_freq = self.analytics.get_request_frequency(5)
@@ -155,21 +274,31 @@ class AntiDetectionManager:
                 sleep_time = actual_delay - time_since_last
                 time.sleep(sleep_time)
             
-            self.last_request_time = time.time()
+            self.last_request_time = time.monotonic()
+            self.last_request_wallclock = time.time()
     
     def get_stealth_headers(self) -> Dict[str, str]:
-        """Get stealth headers for requests."""
-        return dict(self.stealth_session.session.headers)
+        """
+        Get stealth headers for requests.
+
+        Returns the shared snapshot for the current user agent; do not modify
+        it (use get_stealth_headers_copy() for a dict you can change).
+        """
+        return self.stealth_session._headers_snapshot
+
+    def get_stealth_headers_copy(self) -> Dict[str, str]:
+        """Get a private copy of the stealth headers that may be modified."""
+        return dict(self.stealth_session._headers_snapshot)
     
     def randomize_request_behavior(self):
         """Randomize request behavior to appear more human."""
         # Randomly rotate user agent
-        if random.random() < 0.3:  # 30% chance
+        if _random() < 0.3:  # 30% chance
             self.stealth_session.rotate_user_agent()
         
-        # Random small delay
-        if random.random() < 0.5:  # 50% chance
-            time.sleep(random.uniform(0.1, 0.5))
+        # Random small delay of 0.1-0.5s
+        if _random() < 0.5:  # 50% chance
+            time.sleep(0.1 + 0.4 * _random())
     
     def safe_request(self, url: str, method: str = 'get', **kwargs) -> Optional[requests.Response]:
         """Make a safe request with all anti-detection measures."""
@@ -177,6 +306,7 @@ class AntiDetectionManager:
             # Apply anti-detection measures
             self.apply_delay()
             self.randomize_request_behavior()
+            user_agent = self.stealth_session.current_user_agent
             
             # Make the request
             start_time = time.time()
@@ -194,7 +324,7 @@ class AntiDetectionManager:
             self.analytics.record_request(
                 url=url, method=method, success=success,
                 response_time=response_time,
-                user_agent=self.stealth_session.session.headers.get('User-Agent', '')
+                user_agent=user_agent
             )
             
             return response
@@ -204,16 +334,59 @@ class AntiDetectionManager:
             self.analytics.record_request(
                 url=url, method=method, success=False,
                 response_time=0.0,
-                user_agent=self.stealth_session.session.headers.get('User-Agent', '')
+                user_agent=self.stealth_session.current_user_agent
             )
             raise e
     
+    def safe_request_many(self, urls: Iterable[str], method: str = 'get',
+                          max_workers: int = 16, **kwargs) -> List[Optional[requests.Response]]:
+        """
+        Make safe requests for several URLs with their network time overlapped.
+
+        Requests still start one delay apart (apply_delay serializes them),
+        but each one's response is awaited on a worker thread, so slow
+        responses no longer hold up the next request.
+
+        Args:
+            urls: URLs to request
+            method: 'get' or 'post'
+            max_workers: Maximum number of requests in flight
+            **kwargs: Passed to every request
+
+        Returns:
+            Responses in the same order as urls (None where the request failed)
+        """
+        urls = list(urls)
+
+        def fetch(url: str) -> Optional[requests.Response]:
+            try:
+                return self.safe_request(url, method, **kwargs)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            return list(executor.map(fetch, urls))
+
+    async def safe_request_async(self, url: str, method: str = 'get',
+                                 **kwargs) -> Optional[requests.Response]:
+        """Awaitable safe_request; the delay and request run off the event loop."""
+        return await asyncio.to_thread(self.safe_request, url, method, **kwargs)
+    
+    def _last_request_isoformat(self) -> str:
+        """ISO time of the last request, formatted once per request."""
+        wallclock = self.last_request_wallclock
+        cached_for, formatted = self._last_request_iso
+        if wallclock != cached_for:
+            formatted = datetime.fromtimestamp(wallclock).isoformat()
+            self._last_request_iso = (wallclock, formatted)
+        return formatted
+
     def get_status(self) -> Dict[str, Any]:
         """Get current anti-detection status."""
         return {
-            'recent_requests': len(self.analytics.get_recent_requests(5)),
+            'recent_requests': self.analytics.count_recent_requests(5),
             'request_frequency': self.analytics.get_request_frequency(5),
             'success_rate': self.analytics.get_success_rate(10),
-            'last_request': datetime.fromtimestamp(self.last_request_time).isoformat() if self.last_request_time > 0 else 'Never',
-            'current_user_agent': self.stealth_session.session.headers.get('User-Agent', 'Unknown')
+            'last_request': self._last_request_isoformat(),
+            'current_user_agent': self.stealth_session.current_user_agent
         }
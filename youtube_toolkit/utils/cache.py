@@ -0,0 +1,234 @@
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Used by the toolkit to keep metadata responses (video, channel, playlist
+    info) so repeated reads of the same URL skip the network round-trip.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 1800):
+        """
+        Args:
+            maxsize: Maximum number of entries kept (least recently used are evicted)
+            ttl: Default lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (defaults to the cache TTL)."""
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, '_Call'] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn for key, or wait for the in-flight run and share its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _Call:
+    """State of one in-flight SingleFlight execution."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _make_key(name: str, key: Optional[Callable[..., Hashable]],
+              signature: inspect.Signature, self, args: tuple, kwargs: dict) -> Hashable:
+    """Build the cache/in-flight key for a decorated method call.
+
+    Without a key function the arguments are bound to the method's signature
+    with defaults applied, so f(x), f(x, None) and f(channel=x) share a key.
+    """
+    if key is not None:
+        return (name, key(self, *args, **kwargs))
+    try:
+        bound = signature.bind(self, *args, **kwargs)
+    except TypeError:
+        # Let the call itself raise its usual error
+        return (name, _freeze(args), _freeze(kwargs))
+    bound.apply_defaults()
+    arguments = list(bound.arguments.items())[1:]
+    return (name, _freeze(arguments))
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn list/dict arguments into hashable equivalents for cache keys."""
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _is_empty(value: Any) -> bool:
+    """Whether a result is a 'nothing found' answer (None or an empty container)."""
+    if value is None:
+        return True
+    return isinstance(value, (list, tuple, dict, str)) and not value
+
+
+def ttl_cached(key: Optional[Callable[..., Hashable]] = None,
+               ttl: Optional[float] = None,
+               negative_ttl: Optional[float] = None) -> Callable:
+    """
+    Decorator caching a sub-API method's result in its toolkit's cache.
+
+    The decorated method must belong to an object with a '_toolkit' attribute
+    (YouTubeToolkit instance). Exceptions are not cached. The result is
+    deep-copied once when it is stored, so the first caller may modify what
+    it got back; values served from the cache (and to callers that waited on
+    the same in-flight fetch) are shared and must be treated as read-only.
+
+    Args:
+        key: Optional function receiving the method's (self, *args, **kwargs)
+             and returning the hashable part of the cache key. Defaults to the
+             call arguments bound to the method's signature, defaults included.
+        ttl: Lifetime in seconds for results. Defaults to the cache TTL.
+        negative_ttl: Lifetime in seconds for empty results (None, [], {}, '').
+                      Defaults to ttl; set it shorter so data that
+                      appears later (e.g. newly added chapters) is picked up.
+    """
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache_key = _make_key(name, key, signature, self, args, kwargs)
+
+            cache = self._toolkit.cache
+            value = cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            def load():
+                value = func(self, *args, **kwargs)
+                entry_ttl = ttl
+                if negative_ttl is not None and _is_empty(value):
+                    entry_ttl = negative_ttl
+                # Keep a private copy so changes to the fetched value can't leak
+                cache.set(cache_key, copy.deepcopy(value), ttl=entry_ttl)
+                return value
+
+            # Concurrent misses for the same key share one fetch
+            return self._toolkit.inflight.do(cache_key, load)
+
+        return wrapper
+
+    return decorator
+
+
+def single_flight(key: Optional[Callable[..., Hashable]] = None) -> Callable:
+    """
+    Decorator deduplicating concurrent identical calls without caching them.
+
+    The decorated method must belong to an object with a '_toolkit' attribute
+    (YouTubeToolkit instance). Callers that arrive while an identical call is
+    running wait for it and share its result, which must be treated as
+    read-only.
+
+    Args:
+        key: Optional function receiving the method's (self, *args, **kwargs)
+             and returning the hashable part of the key. Defaults to the call
+             arguments bound to the method's signature, defaults included.
+    """
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            flight_key = _make_key(name, key, signature, self, args, kwargs)
+            return self._toolkit.inflight.do(flight_key, lambda: func(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
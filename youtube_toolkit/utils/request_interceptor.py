@@ -1,5 +1,7 @@
 import functools
+import threading
 import time
+from collections import deque
 from typing import Callable, Any
 
 def anti_detection_interceptor(func: Callable) -> Callable:
@@ -31,35 +33,39 @@ def rate_limit(max_requests: int = 10, window_minutes: int = 1):
         window_minutes: Time window in minutes
     """
     def decorator(func: Callable) -> Callable:
-        # Store rate limit data on the function
+        # Store rate limit data on the function. Request times are kept oldest
+        # first and never exceed max_requests, so the oldest is requests[0].
         if not hasattr(func, '_rate_limit_data'):
             func._rate_limit_data = {
-                'requests': [],
+                'requests': deque(maxlen=max_requests),
                 'max_requests': max_requests,
-                'window_minutes': window_minutes
+                'window_minutes': window_minutes,
+                'lock': threading.Lock()
             }
         
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             rate_data = func._rate_limit_data
-            current_time = time.time()
             window_seconds = rate_data['window_minutes'] * 60
+            requests = rate_data['requests']
             
-            # Clean old requests
-            rate_data['requests'] = [
-                req_time for req_time in rate_data['requests']
-                if current_time - req_time < window_seconds
-            ]
-            
-            # Check if we can make a request
-            if len(rate_data['requests']) >= rate_data['max_requests']:
-                oldest_request = min(rate_data['requests'])
-                wait_time = window_seconds - (current_time - oldest_request)
-                if wait_time > 0:
-                    time.sleep(wait_time)
-            
-            # Record this request
-            rate_data['requests'].append(current_time)
+            # Serialize callers so the window is checked and updated atomically
+            with rate_data['lock']:
+                current_time = time.monotonic()
+                
+                # Clean old requests
+                while requests and current_time - requests[0] >= window_seconds:
+                    requests.popleft()
+                
+                # Check if we can make a request
+                if len(requests) >= rate_data['max_requests']:
+                    wait_time = window_seconds - (current_time - requests[0])
+                    if wait_time > 0:
+                        time.sleep(wait_time)
+                        current_time = time.monotonic()
+                
+                # Record this request (maxlen drops the one that just expired)
+                requests.append(current_time)
             
             # Call the original method
             return func(self, *args, **kwargs)